@@ -59,9 +59,9 @@ class TranslationCache:
         Returns:
             Cached value or None
         """
-        if DISKCACHE_AVAILABLE and self.cache:
+        if self.cache is not None:
             try:
-                return self.cache.get(key, default=None, expire_time=True)
+                return self.cache.get(key, default=None)
             except Exception:
                 return None
         else:
@@ -77,7 +77,7 @@ class TranslationCache:
             value: Value to cache
             ttl: Time-to-live in seconds (optional, uses default if not provided)
         """
-        if DISKCACHE_AVAILABLE and self.cache:
+        if self.cache is not None:
             try:
                 expire = ttl or self.ttl
                 self.cache.set(key, value, expire=expire)
@@ -89,7 +89,7 @@ class TranslationCache:
     
     def delete(self, key: str):
         """Delete key from cache."""
-        if DISKCACHE_AVAILABLE and self.cache:
+        if self.cache is not None:
             try:
                 self.cache.delete(key)
             except Exception:
@@ -100,7 +100,7 @@ class TranslationCache:
     
     def clear(self):
         """Clear all cache entries."""
-        if DISKCACHE_AVAILABLE and self.cache:
+        if self.cache is not None:
             try:
                 self.cache.clear()
             except Exception:
@@ -155,9 +155,9 @@ class TranslationCache:
     
     def _key_to_filename(self, key: str) -> str:
         """Convert cache key to filename."""
-        # Hash key to avoid filesystem issues
-        hash_obj = hashlib.md5(key.encode("utf-8"))
-        return f"{hash_obj.hexdigest()}.json"
+        # Hash key to avoid filesystem issues. sha256 is hardware-accelerated in
+        # OpenSSL where md5 is not; 128 bits are plenty for a file name.
+        return f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
     
     def get_translation(self, source_text: str, target_lang: str) -> Optional[str]:
         """
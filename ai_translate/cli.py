@@ -12,6 +12,7 @@ from typing import List, Optional
 import click
 from rich.console import Console
 
+from ai_translate.cache import TranslationCache
 from ai_translate.db_scope import DBExtractor
 from ai_translate.db_write import TranslationDBWriter
 from ai_translate.extractors import LayerAExtractor
@@ -25,6 +26,10 @@ from ai_translate.translator import Translator
 
 console = Console()
 
+# Persistent Groq translation cache shared by all runs (see Translator.disk_cache)
+TRANSLATION_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "ai_translate"
+TRANSLATION_CACHE_TTL = 30 * 24 * 3600  # seconds
+
 class DefaultToTranslateGroup(click.Group):
     """
     Click Group that defaults to `translate` when the first token is not a known subcommand.
@@ -72,6 +77,7 @@ def cli():
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 @click.option('--slow-mode', is_flag=True, hidden=True, help='Enable slow mode (rate limiting) (advanced)')
 @click.option('--dry-run', is_flag=True, help='Dry run mode (no writes)')
+@click.option('--no-cache', is_flag=True, hidden=True, help='Do not reuse translations cached by earlier runs (advanced)')
 def translate(
     apps: str,
     lang: str,
@@ -87,6 +93,7 @@ def translate(
     verbose: bool,
     slow_mode: bool,
     dry_run: bool,
+    no_cache: bool,
 ):
     """Translate app(s) - extracts all user-visible strings and translates missing ones.
     
@@ -116,6 +123,7 @@ def translate(
         verbose=verbose,
         slow_mode=slow_mode,
         dry_run=dry_run,
+        no_cache=no_cache,
     )
 
 
@@ -383,6 +391,8 @@ def review(
             else:
                 output.warning(f"Could not determine locale path for site '{site}', skipping PO/MO sync")
 
+    translator.close()
+
 
 @cli.command(hidden=True)
 @click.argument('apps', required=True)
@@ -427,6 +437,7 @@ def _translate_impl(
     verbose: bool,
     slow_mode: bool,
     dry_run: bool,
+    no_cache: bool = False,
 ):
     """
     Implementation of translate command.
@@ -510,7 +521,15 @@ def _translate_impl(
 
     # Initialize translator
     try:
-        translator = Translator(api_key=api_key, slow_mode=slow_mode, output=output)
+        # Translations from earlier runs are reused, so incremental runs only pay for new strings
+        disk_cache = None
+        if not no_cache:
+            disk_cache = TranslationCache(
+                cache_dir=TRANSLATION_CACHE_DIR, ttl=TRANSLATION_CACHE_TTL
+            )
+        translator = Translator(
+            api_key=api_key, slow_mode=slow_mode, output=output, disk_cache=disk_cache
+        )
     except Exception as e:
         output.error(f"Failed to initialize translator: {e}")
         sys.exit(1)
@@ -652,41 +671,47 @@ def _translate_impl(
         # Apply policy and filter
         # Deduplicate by source_text (Frappe CSV key) to avoid re-sending duplicates from different files/scopes.
         unique_by_text = {}
+        # Bound once: these run for every extracted string.
+        decide = policy.decide
+        # Plain translation lookups: building TranslationEntry objects here would churn the LRU
+        get_existing = storage.get
+        frappe_get = frappe_storage.get if frappe_storage else None
 
         for extracted in app_extracted:
-            decision, reason = policy.decide(extracted.text, extracted.context)
+            decision, reason = decide(extracted.text, extracted.context)
             canon = _canon(extracted.text)
 
             # Check existing translations (exact first, then canonical).
-            existing_entry = storage.get_entry_by_source(extracted.text)
-            exists_via = "exact" if existing_entry else ""
+            existing_translation = get_existing(extracted.text)
+            exists_via = "exact" if existing_translation is not None else ""
             notes: list[str] = []
 
-            if not existing_entry and canon and canon != extracted.text:
-                existing_entry = storage.get_entry_by_source(canon)
-                if existing_entry:
+            if existing_translation is None and canon and canon != extracted.text:
+                existing_translation = get_existing(canon)
+                if existing_translation is not None:
                     exists_via = "canonical"
                     notes.append("matched_existing_via_canonical")
                     # Add an alias for the exact string so runtime lookups hit regardless of encoding.
                     if not dry_run:
                         storage.set(
                             extracted.text,
-                            existing_entry.translated_text,
+                            existing_translation,
                             extracted.context,
                             extracted.source_file,
                             extracted.line_number,
                             update_existing=False,
                         )
                         notes.append("added_alias_row_from_canonical")
+            exists_in_app = existing_translation is not None
 
             exists_in_frappe = False
-            if frappe_storage:
-                if frappe_storage.get(extracted.text) or (canon and frappe_storage.get(canon)):
+            if frappe_get is not None:
+                if frappe_get(extracted.text) or (canon and frappe_get(canon)):
                     exists_in_frappe = True
 
             queued = False
             if decision.value == "translate":
-                queued = not (existing_entry and not repair_existing)
+                queued = not (exists_in_app and not repair_existing)
 
             if diagnose:
                 diagnostics_rows.append(
@@ -699,7 +724,7 @@ def _translate_impl(
                         "source_file": extracted.source_file or "",
                         "decision": decision.value,
                         "reason": (reason.value if reason else ""),
-                        "exists_in_app_csv": bool(existing_entry),
+                        "exists_in_app_csv": exists_in_app,
                         "exists_in_app_csv_via": exists_via,
                         "exists_in_frappe_core": exists_in_frappe,
                         "queued_for_translation": queued,
@@ -708,16 +733,16 @@ def _translate_impl(
                 )
 
             if decision.value == "translate":
-                if existing_entry and not repair_existing:
+                if exists_in_app and not repair_existing:
                     continue
-                if existing_entry and repair_existing:
+                if existing_translation is not None and repair_existing:
                     # Only retranslate clearly corrupted existing entries
-                    if not _should_repair_existing(extracted.text, existing_entry.translated_text):
+                    if not _should_repair_existing(extracted.text, existing_translation):
                         continue
                 # If not present in app translations, also respect frappe core translations
-                if not existing_entry and not repair_existing and frappe_storage:
-                    if frappe_storage.get(extracted.text) or (canon and frappe_storage.get(canon)):
-                        continue
+                # (looked up once above; misses dominate here, so don't repeat the probes)
+                if not exists_in_app and not repair_existing and exists_in_frappe:
+                    continue
                 # Translate missing strings OR ones selected for repair
                 if extracted.text not in unique_by_text:
                     unique_by_text[extracted.text] = extracted
@@ -843,6 +868,7 @@ def _translate_impl(
             total_final_stats[key] += app_stats.get(key, 0)
     
     final_stats = total_final_stats
+    translator.close()
 
     # Print summary only after progress bar is done
     console.print()  # Empty line after progress bar
@@ -4,6 +4,7 @@ import os
 from typing import Dict, Optional
 
 from ai_translate.output import OutputFilter
+from ai_translate.policy import context_key
 from ai_translate.storage import TranslationEntry
 
 
@@ -190,13 +191,7 @@ class TranslationDBWriter:
 
     def _context_to_string(self, context) -> str:
         """Convert context to string."""
-        parts = [
-            context.layer,
-            context.app or "",
-            context.doctype or "",
-            context.fieldname or "",
-        ]
-        return "|".join(parts)
+        return context_key(context)
 
     def get_stats(self) -> dict:
         """Get write statistics."""
@@ -1,7 +1,7 @@
 """Language Memory System - Terminology, Style, and Translation Memory per Language."""
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -27,6 +27,8 @@ class LanguageMemory:
     terminology: Dict[str, str]  # source -> translated term
     style_profile: Dict[str, str]  # context_type -> style (formal/informal/neutral)
     accepted_translations: List[AcceptedTranslation]
+    # Bumped on every terminology change so callers can invalidate derived caches
+    terminology_version: int = field(default=0, compare=False, repr=False)
     
     def get_terminology(self, source: str) -> Optional[str]:
         """Get terminology translation if exists."""
@@ -69,6 +71,7 @@ class LanguageMemory:
     def add_terminology(self, source: str, translated: str):
         """Add terminology entry."""
         self.terminology[source] = translated
+        self.terminology_version += 1
     
     def set_style(self, context_type: str, style: str):
         """Set style for context type."""
@@ -1,9 +1,12 @@
 """Policy Engine - Context-aware decision making for translation."""
 
 import re
+import sys
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Set, Tuple
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple, Union
 
 
 class Decision(Enum):
@@ -27,11 +30,37 @@ class RejectionReason(Enum):
     TECHNICAL_TERM = "technical_term"
 
 
-@dataclass
+class Layer(str, Enum):
+    """Extraction layers (A: code & files, B: UI metadata, C: user content)."""
+
+    A = "A"
+    B = "B"
+    C = "C"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Accepted spellings -> Layer singleton (plain strings in either case, or Layer itself)
+_LAYER_LOOKUP = {
+    **{layer.value: layer for layer in Layer},
+    **{layer.value.lower(): layer for layer in Layer},
+}
+
+# Fieldname / data_nature sets consulted on every decision. Context values are interned in
+# TranslationContext.__post_init__, so membership checks hit the identity fast path.
+_LAYER_A_IDENTIFIER_FIELDS = frozenset({"route", "api_key", "name", "fieldname"})
+_LAYER_B_TRANSLATABLE_NATURES = frozenset({"label", "description", "title"})
+_LAYER_B_IDENTIFIER_FIELDS = frozenset({"name", "route", "link"})
+_LAYER_C_CONTENT_NATURES = frozenset({"content", "body", "message", "subject"})
+_LAYER_C_IDENTIFIER_FIELDS = frozenset({"name", "route", "slug", "url"})
+
+
+@dataclass(slots=True, frozen=True)
 class TranslationContext:
-    """Context information for translation decisions."""
+    """Context information for translation decisions (immutable and hashable)."""
 
-    layer: str  # A, B, or C
+    layer: Union[Layer, str]  # A, B, or C; normalized to a Layer member
     app: Optional[str] = None
     doctype: Optional[str] = None
     fieldname: Optional[str] = None
@@ -40,8 +69,24 @@ class TranslationContext:
     intent: Optional[str] = None  # user-facing, technical, etc.
 
     def __post_init__(self):
-        """Normalize layer to uppercase."""
-        self.layer = self.layer.upper()
+        """Normalize layer to a Layer member."""
+        layer = _LAYER_LOOKUP.get(self.layer)
+        if layer is None:
+            raise ValueError(f"Invalid layer: {self.layer!r} (expected A, B, or C)")
+        # Frozen dataclass: bypass __setattr__ for the one-time normalization
+        object.__setattr__(self, "layer", layer)
+        if self.fieldname:
+            object.__setattr__(self, "fieldname", sys.intern(self.fieldname))
+        if self.data_nature:
+            object.__setattr__(self, "data_nature", sys.intern(self.data_nature))
+
+
+@lru_cache(maxsize=4096)
+def context_key(context: TranslationContext) -> str:
+    """Return the "layer|app|doctype|fieldname" key for a context (memoized per context)."""
+    return "|".join(
+        (context.layer, context.app or "", context.doctype or "", context.fieldname or "")
+    )
 
 
 class PolicyEngine:
@@ -77,8 +122,15 @@ class PolicyEngine:
         re.compile(r'%[sd]'),  # %s, %d
     ]
     _SINGLE_BRACE_FIELD = re.compile(r'(?<!\{)\{[^{}]*\}(?!\})')  # {..} but not {{..}}
+    _PLACEHOLDER_CHAR = re.compile(r'[{}%]')
     _SINGLE_OPEN_BRACE = re.compile(r'(?<!\{)\{(?!\{)')
     _SINGLE_CLOSE_BRACE = re.compile(r'(?<!\})\}(?!\})')
+    # Prefilters applied by decide() before the layer-specific rules
+    _NUMBERS_ONLY = re.compile(r'^\d+$')
+    _ALL_CAPS = re.compile(r'^[A-Z_][A-Z0-9_]*$')
+    _URL_PREFIX = re.compile(r'^[a-z]+://', re.IGNORECASE)
+    _EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    _INNER_WHITESPACE = re.compile(r'\S\s+\S')  # two words separated by any whitespace
 
     # Enhanced blacklist patterns
     BLACKLIST_PATTERNS = [
@@ -108,6 +160,13 @@ class PolicyEngine:
         self.rejection_reasons = {
             reason: 0 for reason in RejectionReason
         }
+        # Per-layer rule sets, resolved once so decide() does a single dict lookup
+        # instead of walking a layer if/elif chain on every call.
+        self._layer_fns = {
+            Layer.A: self._decide_layer_a,
+            Layer.B: self._decide_layer_b,
+            Layer.C: self._decide_layer_c,
+        }
 
     def decide(
         self, text: str, context: TranslationContext
@@ -122,6 +181,40 @@ class PolicyEngine:
         Returns:
             Tuple of (Decision, Optional[RejectionReason])
         """
+        decision, reason = self._classify(text, context)
+        self.stats[decision] += 1
+        if reason:
+            self.rejection_reasons[reason] += 1
+        return decision, reason
+
+    def decide_batch(
+        self, texts: List[str], context: TranslationContext
+    ) -> List[Tuple[Decision, Optional[RejectionReason]]]:
+        """
+        Make translation decisions for many texts sharing one context.
+
+        Equivalent to calling decide() per text, but with the per-call
+        overhead hoisted out of the loop and stats updated once.
+
+        Args:
+            texts: Texts to evaluate
+            context: Translation context shared by all texts
+
+        Returns:
+            List of (Decision, Optional[RejectionReason]) in input order
+        """
+        classify = self._classify
+        results = [classify(text, context) for text in texts]
+        for decision, count in Counter(d for d, _ in results).items():
+            self.stats[decision] += count
+        for reason, count in Counter(r for _, r in results if r).items():
+            self.rejection_reasons[reason] += count
+        return results
+
+    def _classify(
+        self, text: str, context: TranslationContext
+    ) -> Tuple[Decision, Optional[RejectionReason]]:
+        """Decision logic shared by decide() and decide_batch(); does not touch stats."""
         # Normalize text
         text = text.strip()
 
@@ -130,21 +223,19 @@ class PolicyEngine:
             decision = Decision.SKIP
             reason = RejectionReason.EMPTY_TEXT
         # Numbers only
-        elif re.match(r'^\d+$', text):
+        elif self._NUMBERS_ONLY.match(text):
             decision = Decision.SKIP
             reason = RejectionReason.TECHNICAL_TERM
         # ALL_CAPS constants
-        elif re.match(r'^[A-Z_][A-Z0-9_]*$', text) and len(text) > 1:
+        elif self._ALL_CAPS.match(text) and len(text) > 1:
             decision = Decision.SKIP
             reason = RejectionReason.CONTAINS_IDENTIFIER
         # URLs
-        elif re.match(r'^[a-z]+://', text, re.IGNORECASE):
+        elif self._URL_PREFIX.match(text):
             decision = Decision.KEEP_ORIGINAL
             reason = RejectionReason.TECHNICAL_TERM
         # Emails
-        elif re.match(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', text
-        ):
+        elif self._EMAIL.match(text):
             decision = Decision.KEEP_ORIGINAL
             reason = RejectionReason.TECHNICAL_TERM
         # SQL keywords (exact match)
@@ -152,12 +243,8 @@ class PolicyEngine:
             decision = Decision.KEEP_ORIGINAL
             reason = RejectionReason.LOGIC_BEARING
         # Layer-specific rules
-        elif context.layer == "A":
-            decision, reason = self._decide_layer_a(text, context)
-        elif context.layer == "B":
-            decision, reason = self._decide_layer_b(text, context)
-        elif context.layer == "C":
-            decision, reason = self._decide_layer_c(text, context)
+        elif (layer_fn := self._layer_fns.get(context.layer)) is not None:
+            decision, reason = layer_fn(text, context)
         # Field names that are identifiers (fallback)
         elif context.fieldname and self._is_identifier(context.fieldname):
             decision = Decision.KEEP_ORIGINAL
@@ -171,9 +258,6 @@ class PolicyEngine:
             decision = Decision.KEEP_ORIGINAL
             reason = RejectionReason.AMBIGUOUS_CONTEXT
 
-        self.stats[decision] += 1
-        if reason:
-            self.rejection_reasons[reason] += 1
         return decision, reason
     
     def _matches_blacklist(self, text: str) -> bool:
@@ -202,8 +286,8 @@ class PolicyEngine:
         # Has spaces or punctuation (likely natural language)
         if ' ' in text or any(c in text for c in '.,!?;:'):
             return True
-        # Has multiple words
-        if len(text.split()) > 1:
+        # Has multiple words separated by tabs/newlines (spaces are handled above)
+        if self._INNER_WHITESPACE.search(text):
             return True
         return False
 
@@ -212,7 +296,7 @@ class PolicyEngine:
     ) -> Tuple[Decision, Optional[RejectionReason]]:
         """Decision logic for Layer A (Code & Files)."""
         # In code, be very conservative
-        if context.fieldname in ('route', 'api_key', 'name', 'fieldname'):
+        if context.fieldname in _LAYER_A_IDENTIFIER_FIELDS:
             return Decision.KEEP_ORIGINAL, RejectionReason.CONTAINS_IDENTIFIER
         # Code-like strings and identifiers should not be translated in code layer
         if self._is_code_like(text) or self._matches_blacklist(text):
@@ -230,11 +314,11 @@ class PolicyEngine:
     ) -> Tuple[Decision, Optional[RejectionReason]]:
         """Decision logic for Layer B (UI Metadata)."""
         # UI labels and descriptions should be translated
-        if context.data_nature in ('label', 'description', 'title'):
+        if context.data_nature in _LAYER_B_TRANSLATABLE_NATURES:
             if self._looks_translatable(text):
                 return Decision.TRANSLATE, None
         # Technical identifiers
-        if context.fieldname in ('name', 'route', 'link'):
+        if context.fieldname in _LAYER_B_IDENTIFIER_FIELDS:
             return Decision.KEEP_ORIGINAL, RejectionReason.CONTAINS_IDENTIFIER
         if self._looks_translatable(text):
             return Decision.TRANSLATE, None
@@ -245,10 +329,10 @@ class PolicyEngine:
     ) -> Tuple[Decision, Optional[RejectionReason]]:
         """Decision logic for Layer C (User Content)."""
         # User content should generally be translated
-        if context.data_nature in ('content', 'body', 'message', 'subject'):
+        if context.data_nature in _LAYER_C_CONTENT_NATURES:
             return Decision.TRANSLATE, None
         # But preserve technical fields
-        if context.fieldname in ('name', 'route', 'slug', 'url'):
+        if context.fieldname in _LAYER_C_IDENTIFIER_FIELDS:
             return Decision.KEEP_ORIGINAL, RejectionReason.CONTAINS_IDENTIFIER
         if self._looks_translatable(text):
             return Decision.TRANSLATE, None
@@ -265,6 +349,11 @@ class PolicyEngine:
         Returns:
             True if placeholders are preserved, False otherwise
         """
+        # Every placeholder kind needs a brace or "%": plain text on both sides trivially passes
+        has_placeholder_char = self._PLACEHOLDER_CHAR.search
+        if not has_placeholder_char(original) and not has_placeholder_char(translated):
+            return True
+
         # Fast fail on unbalanced single braces (common corruption: introducing "{ }")
         orig_open = len(self._SINGLE_OPEN_BRACE.findall(original))
         orig_close = len(self._SINGLE_CLOSE_BRACE.findall(original))
@@ -290,6 +379,17 @@ class PolicyEngine:
         # Compare tokens exactly: preserves both presence and multiplicity
         return _extract_tokens(original) == _extract_tokens(translated)
 
+    def validate_placeholders_batch(
+        self, originals: List[str], translations: List[str]
+    ) -> List[bool]:
+        """
+        Validate placeholders for parallel lists of originals and translations.
+
+        Returns one validate_placeholders() result per pair; most UI strings have no
+        placeholders and take its fast path.
+        """
+        return list(map(self.validate_placeholders, originals, translations))
+
     def get_stats(self) -> dict:
         """Get decision statistics."""
         stats = {}
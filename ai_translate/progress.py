@@ -16,6 +16,11 @@ from rich.progress import (
 class ProgressTracker:
     """Single-line progress tracker with ETA."""
 
+    # Advances are buffered locally and pushed to rich in chunks, since each
+    # Progress.update takes a lock and recomputes task state.
+    FLUSH_EVERY = 64  # items
+    FLUSH_INTERVAL = 0.25  # seconds
+
     def __init__(self, total: int, description: str = "Processing"):
         """
         Initialize progress tracker.
@@ -40,6 +45,8 @@ class ProgressTracker:
         )
         self.task_id: Optional[int] = None
         self.start_time: Optional[float] = None
+        self._buffered = 0
+        self._last_flush = time.monotonic()
 
     def __enter__(self):
         """Enter context manager."""
@@ -52,12 +59,24 @@ class ProgressTracker:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager."""
+        self.flush()
         self.progress.__exit__(exc_type, exc_val, exc_tb)
 
     def update(self, advance: int = 1):
-        """Update progress."""
-        if self.task_id is not None:
-            self.progress.update(self.task_id, advance=advance)
+        """Update progress (buffered; see FLUSH_EVERY / FLUSH_INTERVAL)."""
+        self._buffered += advance
+        if (
+            self._buffered >= self.FLUSH_EVERY
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def flush(self):
+        """Push any buffered advance to the progress bar."""
+        if self.task_id is not None and self._buffered:
+            self.progress.update(self.task_id, advance=self._buffered)
+            self._buffered = 0
+        self._last_flush = time.monotonic()
 
     def set_description(self, description: str):
         """Update description."""
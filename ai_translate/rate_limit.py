@@ -0,0 +1,54 @@
+"""Token-bucket rate limiting for API requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens per second, holds at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float) -> "TokenBucket":
+        """Bucket allowing `requests_per_minute`, with bursts up to one minute's worth."""
+        return cls(rate=requests_per_minute / 60.0, capacity=requests_per_minute)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take `tokens` if available right now; never blocks."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then take them."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/check meanwhile
+            time.sleep(wait)
@@ -1,7 +1,7 @@
 """Review System - Manage translation reviews and approvals."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ai_translate.language_memory import LanguageMemoryManager
 from ai_translate.storage import TranslationEntry, TranslationStorage
@@ -24,6 +24,19 @@ class ReviewManager:
         """
         self.storage = storage
         self.memory_manager = memory_manager
+        # Filtered results per status, tagged with the storage revision they were built from;
+        # any storage.set() (including approve/reject/update_confidence) makes them stale
+        self._review_cache: Dict[Optional[str], Tuple[int, List[TranslationEntry]]] = {}
+
+    def invalidate_cache(self):
+        """Drop cached review listings (call after editing entries in place)."""
+        self._review_cache.clear()
+
+    def flush(self):
+        """Persist storage (and language memory) after a run of flush=False calls."""
+        self.storage.save()
+        if self.memory_manager:
+            self.memory_manager.save_memory(self.storage.lang)
     
     def list_needing_review(
         self, status: Optional[str] = None
@@ -37,23 +50,31 @@ class ReviewManager:
         Returns:
             List of translation entries
         """
+        revision = self.storage.revision
+        cached = self._review_cache.get(status)
+        if cached is not None and cached[0] == revision:
+            return list(cached[1])
+
         all_entries = self.storage.get_all()
         
         if status:
-            return [
+            entries = [
                 e for e in all_entries
                 if e.review_status == status or (status == "needs_review" and e.needs_review)
             ]
         else:
-            return [
+            entries = [
                 e for e in all_entries
                 if e.needs_review or e.review_status == "needs_review"
             ]
+        self._review_cache[status] = (revision, entries)
+        return list(entries)
     
     def approve(
         self,
         source_text: str,
         update_memory: bool = True,
+        flush: bool = True,
     ) -> bool:
         """
         Approve a translation.
@@ -61,6 +82,7 @@ class ReviewManager:
         Args:
             source_text: Source text to approve
             update_memory: Update language memory with approved translation
+            flush: Save storage/memory now; pass False in bulk loops and call flush() once
             
         Returns:
             True if successful
@@ -83,7 +105,9 @@ class ReviewManager:
             entry.line_number,
             update_existing=True,
         )
-        self.storage.save()
+        if flush:
+            self.storage.save()
+        self.invalidate_cache()
         
         # Update memory if requested
         if update_memory and self.memory_manager:
@@ -96,7 +120,8 @@ class ReviewManager:
                 confidence=0.95,
                 review_status="approved",
             )
-            self.memory_manager.save_memory(self.storage.lang)
+            if flush:
+                self.memory_manager.save_memory(self.storage.lang)
         
         return True
     
@@ -104,6 +129,7 @@ class ReviewManager:
         self,
         source_text: str,
         reason: Optional[str] = None,
+        flush: bool = True,
     ) -> bool:
         """
         Reject a translation.
@@ -111,6 +137,7 @@ class ReviewManager:
         Args:
             source_text: Source text to reject
             reason: Optional rejection reason
+            flush: Save storage now; pass False in bulk loops and call flush() once
             
         Returns:
             True if successful
@@ -133,7 +160,9 @@ class ReviewManager:
             entry.line_number,
             update_existing=True,
         )
-        self.storage.save()
+        if flush:
+            self.storage.save()
+        self.invalidate_cache()
         
         return True
     
@@ -141,6 +170,7 @@ class ReviewManager:
         self,
         source_text: str,
         confidence: float,
+        flush: bool = True,
     ) -> bool:
         """
         Update confidence score for a translation.
@@ -148,6 +178,7 @@ class ReviewManager:
         Args:
             source_text: Source text
             confidence: Confidence score (0.0-1.0)
+            flush: Save storage now; pass False in bulk loops and call flush() once
             
         Returns:
             True if successful
@@ -174,7 +205,9 @@ class ReviewManager:
             entry.line_number,
             update_existing=True,
         )
-        self.storage.save()
+        if flush:
+            self.storage.save()
+        self.invalidate_cache()
         
         return True
     
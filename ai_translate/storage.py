@@ -1,15 +1,37 @@
 """CSV-based translation storage and management."""
 
 import csv
-import hashlib
+import io
+import mmap
+import os
+import re
+import tempfile
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ai_translate.policy import TranslationContext
+from ai_translate.policy import TranslationContext, context_key
 
+_WHITESPACE_RUN = re.compile(r"\s+")
+# Anything " ".join(text.split()) would change: edge whitespace, runs, or non-space whitespace
+_NEEDS_NORMALIZING = re.compile(r"^\s|\s$|\s\s|[^\S ]")
+# Context for rows loaded from disk; TranslationContext is frozen, so one instance is shared
+_DEFAULT_CTX = TranslationContext(layer="A")
+# A CR that does not start a CRLF: the csv module ends a row there, mm.readline does not
+_LONE_CR = re.compile(rb"\r(?!\n)")
 
-@dataclass
+
+@lru_cache(maxsize=8192)
+def _normalize_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces and trim; returns text itself if already clean."""
+    if not _NEEDS_NORMALIZING.search(text):
+        return text
+    return _WHITESPACE_RUN.sub(" ", text).strip()
+
+
+@dataclass(slots=True)
 class TranslationEntry:
     """Translation entry with context."""
 
@@ -26,16 +48,25 @@ class TranslationEntry:
 class TranslationStorage:
     """CSV-based translation storage."""
 
-    def __init__(self, storage_path: Path, lang: str):
+    # Full-file CSV passes read in 1 MiB chunks instead of the default 8 KiB.
+    READ_BUFFER_SIZE = 1024 * 1024
+    # Files at least this large are bulk-parsed with pyarrow when it is installed;
+    # below it, the pyarrow import costs more than it saves.
+    ARROW_MIN_FILE_SIZE = 256 * 1024
+
+    def __init__(self, storage_path: Path, lang: str, max_entries: int = 200_000):
         """
         Initialize translation storage.
 
         Args:
             storage_path: Base path for storage (can be app translations dir or site dir)
             lang: Language code
+            max_entries: Max TranslationEntry objects kept in memory (least recently used are
+                dropped; translations themselves are always kept and saved)
         """
         self.storage_path = Path(storage_path)
         self.lang = lang
+        self.max_entries = max_entries
         
         # Check if storage_path is already the translations directory
         if storage_path.name == "translations":
@@ -45,7 +76,16 @@ class TranslationStorage:
             self.csv_path = storage_path / "translations" / f"{lang}.csv"
         
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
-        self._cache: Dict[str, TranslationEntry] = {}
+        # Keyed by exact source_text (Frappe's lookup key); the dict hashes the str itself.
+        # The hot path only needs source -> translation, so that lives in a flat dict. Full
+        # TranslationEntry objects (context, review metadata) are kept separately and only
+        # built on demand for rows that were loaded from disk, in an LRU bounded by max_entries.
+        self._translations: Dict[str, str] = {}
+        self._entries: "OrderedDict[str, TranslationEntry]" = OrderedDict()
+        # True once the in-memory translations differ from what is on disk
+        self._dirty = False
+        # Bumped on every set()/deduplicate(), so readers can tell cached views are stale
+        self.revision = 0
         # Frappe translation CSVs are two columns (Source/Translation). Some files include a header
         # row (often: Source,Translation) and some do not. We support reading both styles.
         self._csv_has_header: Optional[bool] = None
@@ -62,65 +102,137 @@ class TranslationStorage:
         if not self.csv_path.exists():
             return
 
-        # First try to sniff header by reading the first row.
+        if self.csv_path.stat().st_size >= self.ARROW_MIN_FILE_SIZE:
+            rows = self._read_arrow_rows()
+            if rows is not None:
+                yield from rows
+                return
+
+        # Single open for both paths: the file is mapped once to look for quote bytes, and the
+        # same handle is rewound for the csv module when quoting is present.
         try:
-            with open(self.csv_path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                first = next(reader, None)
-                if not first:
+            with open(self.csv_path, "rb", buffering=self.READ_BUFFER_SIZE) as f:
+                if os.fstat(f.fileno()).st_size == 0:
                     self._csv_has_header = False
                     return
-
-                lowered = [c.strip().lower() for c in first]
-                # Common header variants
-                header_like = (
-                    ("source_text" in lowered and "translated_text" in lowered)
-                    or ("source" in lowered and "translation" in lowered)
-                    or ("source" in lowered and "translated" in lowered)
-                )
-
-                # If it looks like a header row, switch to DictReader (rewind the file).
-                if header_like:
-                    self._csv_has_header = True
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Fast path: Frappe CSVs rarely need quoting. Without any quote byte, every
+                    # line is a plain comma-separated row and can be split on the mapped bytes.
+                    # CR-only line endings (old Mac/Excel exports) go to the csv module instead.
+                    if mm.find(b'"') == -1 and _LONE_CR.search(mm) is None:
+                        yield from self._pairs_from_rows(
+                            line.decode("utf-8").split(",")
+                            for line in (raw.rstrip(b"\r\n") for raw in iter(mm.readline, b""))
+                            if line
+                        )
+                        return
+                # Quoted fields present: let the csv module handle them.
+                f.seek(0)
+                text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+                yield from self._pairs_from_rows(csv.reader(text))
         except Exception:
             # If we can't read it, let callers treat as empty.
             return
 
-        # Header CSV
-        if self._csv_has_header:
-            try:
-                with open(self.csv_path, "r", encoding="utf-8", newline="") as f:
-                    dr = csv.DictReader(f)
-                    for row in dr:
-                        if not row:
-                            continue
-                        # Accept a few common fieldname variants
-                        src = (row.get("source_text") or row.get("source") or "").strip()
-                        tr = (row.get("translated_text") or row.get("translated") or row.get("translation") or "").strip()
-                        if src:
-                            yield (src, tr)
-                return
-            except Exception:
-                # Fall through to headerless parsing
-                self._csv_has_header = False
+    def _read_arrow_rows(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        Parse the whole CSV with pyarrow's C++ reader (optional dependency).
+
+        Returns None when pyarrow is not installed or the file is irregular (e.g. rows with
+        differing column counts), so callers fall back to the pure-Python readers.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            return None
 
-        # Headerless CSV (default)
-        self._csv_has_header = False
         try:
             with open(self.csv_path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if not row:
-                        continue
-                    # Expect at least 2 columns; ignore extras
-                    if len(row) < 2:
-                        continue
-                    src = (row[0] or "").strip()
-                    tr = (row[1] or "").strip()
-                    if src:
-                        yield (src, tr)
+                first = next(csv.reader(f), None)
+            if not first:
+                return None
+            names = [f"c{i}" for i in range(len(first))]
+            table = pa_csv.read_csv(
+                self.csv_path,
+                read_options=pa_csv.ReadOptions(column_names=names),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                # Keep every cell a string: no numeric inference, no null conversion
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in names},
+                ),
+            )
         except Exception:
-            return
+            return None
+
+        columns = self._header_columns(first)
+        self._csv_has_header = columns is not None
+        if columns is None:
+            # Headerless: expect at least 2 columns; ignore extras
+            if len(names) < 2:
+                return []
+            columns = (0, 1)
+            start = 0
+        else:
+            start = 1
+        sources = table.column(columns[0]).to_pylist()[start:]
+        translations = table.column(columns[1]).to_pylist()[start:]
+        strip = str.strip
+        return [
+            (src, strip(tr))
+            for src, tr in zip(map(strip, sources), translations)
+            if src
+        ]
+
+    def _pairs_from_rows(self, rows: Iterable[List[str]]) -> Iterator[Tuple[str, str]]:
+        """
+        Turn parsed CSV rows into (source_text, translated_text) pairs.
+
+        The first non-empty row decides whether the file has a header; header columns are
+        matched case-insensitively (Source/Translation, source_text/translated_text, ...).
+        """
+        columns: Optional[Tuple[int, int]] = None  # (source, translation) indices if header
+        first = True
+        self._csv_has_header = False
+        for fields in rows:
+            if not fields:
+                continue
+            if first:
+                first = False
+                columns = self._header_columns(fields)
+                self._csv_has_header = columns is not None
+                if columns is not None:
+                    continue
+            if columns is None:
+                # Headerless: expect at least 2 columns; ignore extras
+                if len(fields) < 2:
+                    continue
+                src, tr = fields[0], fields[1]
+            else:
+                src_idx, tr_idx = columns
+                src = fields[src_idx] if src_idx < len(fields) else ""
+                tr = fields[tr_idx] if tr_idx < len(fields) else ""
+            # Frappe files are normally unpadded: only pay for strip() when an edge is whitespace
+            if src and (src[0].isspace() or src[-1].isspace()):
+                src = src.strip()
+            if tr and (tr[0].isspace() or tr[-1].isspace()):
+                tr = tr.strip()
+            if src:
+                yield (src, tr)
+
+    @staticmethod
+    def _header_columns(cells: List[str]) -> Optional[Tuple[int, int]]:
+        """Return (source_idx, translation_idx) if cells look like a header row, else None."""
+        lowered = [c.strip().lower() for c in cells]
+        # Common header variants
+        for src_name, tr_name in (
+            ("source_text", "translated_text"),
+            ("source", "translation"),
+            ("source", "translated"),
+        ):
+            if src_name in lowered and tr_name in lowered:
+                return lowered.index(src_name), lowered.index(tr_name)
+        return None
 
     def _load_cache(self):
         """Load existing translations from CSV."""
@@ -131,25 +243,13 @@ class TranslationStorage:
         # We intentionally do not normalize or rewrite keys here. Frappe looks up translations by the
         # exact source_text, so preserving existing rows exactly is critical.
         try:
-            for source_text, translated_text in self._iter_existing_rows():
-                context = TranslationContext(layer="A")
-                key = self._make_key(source_text, "")
-                self._cache[key] = TranslationEntry(
-                    source_text=source_text,
-                    translated_text=translated_text,
-                    context=context,
-                )
+            self._translations.update(self._iter_existing_rows())
         except Exception:
             # Start fresh if CSV is corrupted/unreadable
-            self._cache = {}
+            self._translations = {}
             if self._csv_has_header is None:
                 self._csv_has_header = False
 
-    def _make_key(self, source_text: str, context_str: str = "") -> str:
-        """Create cache key."""
-        combined = f"{source_text}|{context_str}"
-        return hashlib.md5(combined.encode()).hexdigest()
-
     def get(
         self, source_text: str, context: Optional[TranslationContext] = None
     ) -> Optional[str]:
@@ -163,22 +263,9 @@ class TranslationStorage:
         Returns:
             Translated text or None
         """
-        # Frappe uses source_text as unique key (case-sensitive)
-        # Try exact match first (Frappe standard)
-        key = self._make_key(source_text, "")
-        entry = self._cache.get(key)
-        if entry:
-            return entry.translated_text
-        
-        # Try with context if provided (for backward compatibility)
-        if context:
-            context_str = self._context_to_string(context)
-            key = self._make_key(source_text, context_str)
-            entry = self._cache.get(key)
-            if entry:
-                return entry.translated_text
-        
-        return None
+        # Frappe uses source_text as unique key (case-sensitive); context does not
+        # participate in the key, since set() never stores per-context rows.
+        return self._translations.get(source_text)
     
     def get_entry_by_source(self, source_text: str) -> Optional[TranslationEntry]:
         """
@@ -190,8 +277,29 @@ class TranslationStorage:
         Returns:
             TranslationEntry or None
         """
-        key = self._make_key(source_text, "")
-        return self._cache.get(key)
+        entry = self._entries.get(source_text)
+        if entry is not None:
+            self._entries.move_to_end(source_text)
+            return entry
+        translated_text = self._translations.get(source_text)
+        if translated_text is None:
+            return None
+        # Row loaded from disk (or evicted): materialize and keep its entry on access
+        entry = TranslationEntry(
+            source_text=source_text,
+            translated_text=translated_text,
+            context=_DEFAULT_CTX,
+        )
+        self._remember_entry(entry)
+        return entry
+
+    def _remember_entry(self, entry: TranslationEntry):
+        """Insert/refresh an entry in the LRU, evicting the oldest beyond max_entries."""
+        entries = self._entries
+        entries[entry.source_text] = entry
+        entries.move_to_end(entry.source_text)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
 
     def set(
         self,
@@ -215,60 +323,104 @@ class TranslationStorage:
         """
         # Frappe standard: use source_text as unique key
         # This allows overwriting existing translations and merging with Frappe files
-        key = self._make_key(source_text, "")
-        if not update_existing and key in self._cache:
+        if not update_existing and source_text in self._translations:
             return
-        entry = TranslationEntry(
-            source_text=source_text,
-            translated_text=translated_text,
-            context=context,
-            source_file=source_file,
-            line_number=line_number,
+        self.revision += 1
+        if self._translations.get(source_text) != translated_text:
+            self._translations[source_text] = translated_text
+            self._dirty = True
+        self._remember_entry(
+            TranslationEntry(
+                source_text=source_text,
+                translated_text=translated_text,
+                context=context,
+                source_file=source_file,
+                line_number=line_number,
+            )
         )
-        self._cache[key] = entry
 
     def save(self):
         """Save all translations to CSV without deleting existing entries.
 
         Frappe translation CSV is a two-column dictionary: Source -> Translation.
         We write the header row as: Source,Translation (Frappe docs style).
+        Skipped when nothing changed since the last load/save.
         """
+        if not self._dirty and self.csv_path.exists():
+            return
 
-        # Sort by source_text for consistent output
-        entries = sorted(self._cache.values(), key=lambda e: (e.source_text or "").lower())
+        # Sort by source_text for consistent output (str.lower runs in C, no per-item lambda)
+        translations = self._translations
+        keys = sorted(translations, key=str.lower)
 
-        with open(self.csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Source", "Translation"])
-            for e in entries:
-                writer.writerow([e.source_text, e.translated_text])
+        # Write to a temp file next to the target and swap it in atomically, so an interrupted
+        # save can never leave a truncated CSV behind.
+        try:
+            mode = self.csv_path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        tmp = tempfile.NamedTemporaryFile(
+            "w",
+            dir=self.csv_path.parent,
+            prefix=f".{self.csv_path.name}.",
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+            newline="",
+        )
+        try:
+            with tmp:
+                writer = csv.writer(tmp, lineterminator="\n")
+                writer.writerow(("Source", "Translation"))
+                writer.writerows((k, translations[k]) for k in keys)
+            os.chmod(tmp.name, mode)
+            os.replace(tmp.name, self.csv_path)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for deduplication."""
-        return " ".join(text.split())
+        return _normalize_whitespace(text)
 
     def _context_to_string(self, context: TranslationContext) -> str:
         """Convert context to string for key generation."""
-        parts = [
-            context.layer,
-            context.app or "",
-            context.doctype or "",
-            context.fieldname or "",
-        ]
-        return "|".join(parts)
+        return context_key(context)
 
     def get_all(self) -> List[TranslationEntry]:
-        """Get all translation entries."""
-        return list(self._cache.values())
+        """Get all translation entries.
+
+        Uncached rows get fresh default entries that are not added to the LRU, so a full
+        listing never evicts entries carrying context or review metadata.
+        """
+        entries = self._entries
+        return [
+            entries.get(source_text)
+            or TranslationEntry(
+                source_text=source_text,
+                translated_text=translated_text,
+                context=_DEFAULT_CTX,
+            )
+            for source_text, translated_text in self._translations.items()
+        ]
 
     def deduplicate(self):
         """Remove duplicate entries."""
-        seen: Set[str] = set()
-        unique: Dict[str, TranslationEntry] = {}
-        for key, entry in self._cache.items():
-            normalized = self._normalize_text(entry.source_text)
-            if normalized not in seen:
-                seen.add(normalized)
-                unique[key] = entry
-        self._cache = unique
+        translations = self._translations
+        # normalized -> first source_text seen with that normalization, in one pass
+        first: Dict[str, str] = {}
+        setdefault = first.setdefault
+        for source_text in translations:
+            setdefault(_normalize_whitespace(source_text), source_text)
+        if len(first) == len(translations):
+            return
+        unique = {source_text: translations[source_text] for source_text in first.values()}
+        self._dirty = True
+        self.revision += 1
+        self._translations = unique
+        self._entries = OrderedDict((k, v) for k, v in self._entries.items() if k in unique)
 
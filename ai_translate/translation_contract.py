@@ -1,12 +1,20 @@
 """Translation Contract Builder - Language-specific translation contracts."""
 
+import re
 from typing import Dict, List, Optional
 
 from ai_translate.language_memory import LanguageMemory
 
+# A whitespace-delimited word with leading/trailing ".,!?;:" trimmed, i.e. the same
+# tokens as [w.strip(".,!?;:") for w in text.split()] minus the empty ones
+_TERM_TOKEN_RE = re.compile(r"[^\s.,!?;:](?:\S*[^\s.,!?;:])?")
+
 
 class TranslationContract:
     """Translation contract for a specific language."""
+
+    # Max source texts whose terminology matches are remembered
+    TERM_CACHE_SIZE = 8192
     
     def __init__(self, memory: LanguageMemory):
         """
@@ -17,6 +25,9 @@ class TranslationContract:
         """
         self.memory = memory
         self.lang = memory.lang
+        # source text -> matched terms; valid for one memory.terminology_version
+        self._term_matches: Dict[str, Dict[str, str]] = {}
+        self._term_matches_version = memory.terminology_version
     
     def build_prompt(
         self,
@@ -77,16 +88,40 @@ Translation:"""
         
         return prompt
     
+    def _match_terms(self, text: str) -> Dict[str, str]:
+        """
+        Terminology entries whose source term appears as a word in text, in text order.
+
+        The same source is typically matched several times (prompt, consistency check,
+        terminology check), so results are memoized until the terminology changes.
+        Callers must not mutate the returned dict.
+        """
+        if self._term_matches_version != self.memory.terminology_version:
+            self._term_matches.clear()
+            self._term_matches_version = self.memory.terminology_version
+        found = self._term_matches.get(text)
+        if found is not None:
+            return found
+
+        terminology = self.memory.terminology
+        tokens = _TERM_TOKEN_RE.findall(text)
+        # Set intersection runs in C; only the (usually empty) hits are walked in Python
+        hits = terminology.keys() & tokens
+        found = {}
+        if hits:
+            for token in tokens:
+                if token in hits:
+                    found[token] = terminology[token]
+
+        if len(self._term_matches) >= self.TERM_CACHE_SIZE:
+            self._term_matches.clear()
+        self._term_matches[text] = found
+        return found
+
     def _build_terminology_section(self, text: str) -> str:
         """Build terminology section from memory."""
         # Extract potential terms from text
-        words = text.split()
-        relevant_terms = {}
-        
-        for word in words:
-            clean_word = word.strip(".,!?;:")
-            if clean_word in self.memory.terminology:
-                relevant_terms[clean_word] = self.memory.terminology[clean_word]
+        relevant_terms = self._match_terms(text)
         
         if not relevant_terms:
             return ""
@@ -144,14 +179,11 @@ Translation:"""
             Tuple of (is_consistent, reason_if_not)
         """
         # Check terminology consistency
-        words = source.split()
-        for word in words:
-            clean_word = word.strip(".,!?;:")
-            if clean_word in self.memory.terminology:
-                expected_translation = self.memory.terminology[clean_word]
-                # Check if expected term appears in translation
-                if expected_translation.lower() not in translated.lower():
-                    return False, f"Term '{clean_word}' should be translated as '{expected_translation}'"
+        translated_lower = translated.lower()
+        for clean_word, expected_translation in self._match_terms(source).items():
+            # Check if expected term appears in translation
+            if expected_translation.lower() not in translated_lower:
+                return False, f"Term '{clean_word}' should be translated as '{expected_translation}'"
         
         # Check against examples
         examples = self.memory.get_examples(context_type)
@@ -174,13 +206,5 @@ Translation:"""
         Returns:
             Dictionary of found terms and their translations
         """
-        found_terms = {}
-        words = text.split()
-        
-        for word in words:
-            clean_word = word.strip(".,!?;:")
-            if clean_word in self.memory.terminology:
-                found_terms[clean_word] = self.memory.terminology[clean_word]
-        
-        return found_terms
+        return dict(self._match_terms(text))
 
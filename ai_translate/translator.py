@@ -1,27 +1,286 @@
 """Groq API integration for translation."""
 
+import importlib.util
+import json
 import os
+import queue
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
 try:
-    from groq import Groq  # type: ignore
-except Exception:  # pragma: no cover
-    Groq = None  # type: ignore
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# h2 enables HTTP/2 in httpx; only checked for here, httpx imports it when needed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
+from ai_translate.cache import TranslationCache
 from ai_translate.output import OutputFilter
-from ai_translate.policy import PolicyEngine
+from ai_translate.policy import PolicyEngine, TranslationContext
+from ai_translate.rate_limit import TokenBucket
+
+# All placeholder kinds in one alternation, tried in this order at each position:
+# {{ var }}, %(name)s, %s/%d, {field}
+_PLACEHOLDER_RE = re.compile(
+    r"(?P<PH_JINJA>\{\{[^}]+\}\})"
+    r"|(?P<PH_PERCENT_NAMED>%\([^)]+\)s)"
+    r"|(?P<PH_PERCENT_SIMPLE>%[sd])"
+    r"|(?P<PH_BRACE>(?<!\{)\{[^{}]*\}(?!\}))"
+)
+# Minimal context for the policy check in translate(); immutable, so shared by every call
+_POLICY_CTX_A = TranslationContext(layer="A")
+# Static instructions live in the system message so every request shares a byte-identical
+# prefix (provider-side prompt caching); the user message only carries per-request data.
+_PROMPT_RULES = """Rules:
+- Preserve ALL placeholders exactly as they appear (e.g., {0}, {1}, %(name)s, {{ var }})
+- Keep the same formatting and structure
+- Do NOT translate technical terms, code, URLs, or email addresses
+- Translate according to meaning and context, not word-by-word
+"""
+_SINGLE_SYSTEM_PROMPT = (
+    "You are a professional translator. Return ONLY the translated text, nothing else. "
+    "Preserve all placeholders exactly.\n\n"
+    + _PROMPT_RULES
+    + "- Return ONLY the translated text, no explanations, no instructions, no additional text"
+)
+_BATCH_SYSTEM_PROMPT = (
+    "You are a professional translator. Return translations in JSON format or "
+    "newline-separated format. Preserve all placeholders exactly.\n\n"
+    + _PROMPT_RULES
+    + "- Return translations in the same order, one per line, or as JSON array"
+)
+# Shared, never mutated: the same message object goes into every request
+_SINGLE_SYSTEM_MESSAGE = {"role": "system", "content": _SINGLE_SYSTEM_PROMPT}
+_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": _BATCH_SYSTEM_PROMPT}
+
+# Tokens emitted by _mask_placeholders, e.g. __PH_BRACE_0__
+_PLACEHOLDER_TOKEN_RE = re.compile(r"__PH_[A-Z_]+_(\d+)__")
+
+# Masked placeholders as parallel sequences: tokens[i] stands for values[i], and i is the
+# number inside the token. Most UI strings have none and share _NO_PLACEHOLDERS.
+PlaceholderMap = Tuple[Sequence[str], Sequence[str]]
+_NO_PLACEHOLDERS: PlaceholderMap = ((), ())
+# What a batched request tells the batch-size tuner: (reply parsed, seconds spent on the API
+# call and parse), or None when no reply came back (all hits cached, or every call errored)
+BatchFeedback = Optional[Tuple[bool, float]]
+# Lines of a reply that echo prompt instructions rather than translate
+_INSTRUCTION_LINE_RE = re.compile(
+    r"important:|rules:|preserve|do not|return|translation:|نص|مهم|احفظ|لا تترجم", re.IGNORECASE
+)
+# ...unless they also carry translation content
+_TRANSLATION_WORD_RE = re.compile(r"translate|ترجمة|translation", re.IGNORECASE)
+# Label in front of the answer in a single-text reply
+_TRANSLATION_MARKER_RE = re.compile(r"translation:|ترجمة", re.IGNORECASE)
+_BATCH_INSTRUCTION_LINE_RE = re.compile(
+    r"important:|rules:|preserve|do not|return|translation:|translations:", re.IGNORECASE
+)
+# "12. text" item of a numbered batch reply (lines are already stripped)
+_NUMBERED_LINE_RE = re.compile(r"(\d+)\.\s+(.*)", re.DOTALL)
+# Where long texts may be split: whitespace after a sentence end
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# Batch reply that looks like a JSON array (checked without copying the reply)
+_JSON_ARRAY_START_RE = re.compile(r"\s*\[")
+# Arabic blocks + extended Arabic
+_ARABIC_CHAR_RE = re.compile(r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]")
+# CJK Unified + Extensions + Hiragana/Katakana (common Chinese/Japanese outputs)
+_CJK_CHAR_RE = re.compile(r"[\u4E00-\u9FFF\u3400-\u4DBF\u3040-\u30FF]")
+
+
+def _load_groq():
+    """
+    The groq SDK module, or None if it isn't installed.
+
+    Imported on first use rather than with this module: groq pulls in httpx and pydantic,
+    which would otherwise dominate CLI startup even for commands that never translate.
+    """
+    try:
+        import groq  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return groq
+
+
+def _is_groq_error(error: Exception, *names: str) -> bool:
+    """Whether `error` is one of the named groq exception classes."""
+    groq = _load_groq()
+    return groq is not None and isinstance(error, tuple(getattr(groq, n) for n in names))
+
+
+def _build_http_client(max_connections: int) -> Optional["httpx.Client"]:
+    """
+    Shared keep-alive HTTP client for Groq calls, so retries, model fallbacks and
+    concurrent batches reuse connections instead of repeating TCP/TLS handshakes.
+    Uses HTTP/2 when the optional h2 package is installed. Returns None when httpx
+    is unavailable (Groq then builds its default client).
+    """
+    try:
+        import httpx  # installed with groq
+    except ImportError:  # pragma: no cover
+        return None
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=max_connections, max_connections=max_connections * 2
+        ),
+    )
+
+
+@lru_cache(maxsize=64)
+def _single_prompt_prefix(source_lang: str, target_lang: str, context: Optional[str]) -> str:
+    """Per-run constant start of the single-text prompt."""
+    prefix = f"Translate the following text from {source_lang} to {target_lang}."
+    if context:
+        prefix += (
+            f"\nContext: This text is from a {context}. "
+            "Translate according to the meaning and context, not literally."
+        )
+    return prefix
+
+
+@lru_cache(maxsize=64)
+def _batch_prompt_header(source_lang: str, target_lang: str, context: Optional[str]) -> str:
+    """Per-run constant part of the batch prompt header, after the text count."""
+    header = f" from {source_lang} to {target_lang}."
+    if context:
+        header += (
+            f"\nContext: These texts are from a {context}. "
+            "Translate according to the meaning and context, not literally."
+        )
+    return header + "\n\nTexts:\n"
+
+
+def _clean_translation(raw: str) -> str:
+    """
+    Strip instruction echoes and a leading "Translation:" label from a single-text reply.
+
+    Drops lines that match an instruction keyword but carry no translation content.
+    Leading/trailing blank lines go with the final strip(); blank lines inside the text
+    are kept.
+    """
+    translated = "\n".join(
+        line
+        for line in (raw_line.strip() for raw_line in raw.splitlines())
+        if not _INSTRUCTION_LINE_RE.search(line) or _TRANSLATION_WORD_RE.search(line)
+    ).strip()
+
+    # If the reply still labels its answer ("Translation: ..."), keep what follows the
+    # label's colon; one regex search finds the label without lowercasing the text
+    marker = _TRANSLATION_MARKER_RE.search(translated)
+    if marker is not None:
+        colon = translated.find(":", marker.start())
+        if colon >= 0:
+            translated = translated[colon + 1 :].strip()
+    return translated
+
+
+def _split_long_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text at sentence ends into pieces of about `max_chars` at most.
+
+    Whitespace after a cut stays at the end of the earlier piece, so the pieces join back
+    to `text`. Never cuts inside a placeholder; a single longer sentence stays whole.
+    """
+    protected = [m.span() for m in _PLACEHOLDER_RE.finditer(text)]
+    pieces: List[str] = []
+    start = last_cut = 0
+    for m in _SENTENCE_END_RE.finditer(text):
+        if any(a < m.start() < b for a, b in protected):
+            continue
+        if m.end() - start > max_chars and last_cut > start:
+            pieces.append(text[start:last_cut])
+            start = last_cut
+        last_cut = m.end()
+    if len(text) - start > max_chars and last_cut > start:
+        pieces.append(text[start:last_cut])
+        start = last_cut
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+def _is_model_unavailable(error: Exception) -> bool:
+    """
+    Whether an API error means the model itself can't be used (unknown or decommissioned).
+
+    Rate limits and 5xx errors don't count: the client has already retried those with
+    backoff, and the model stays enabled for later calls.
+    """
+    if _is_groq_error(error, "NotFoundError"):
+        return True
+    return _is_groq_error(error, "BadRequestError") and "decommissioned" in str(error).lower()
 
 
 class Translator:
     """Groq API translator with batching and retry logic."""
 
+    # translate_bulk only goes through the (slow, cheap) Batch API from this many texts up
+    BULK_MIN_TEXTS = 500
+    BULK_POLL_INTERVAL = 30.0  # seconds between batch job status checks
+
+    REQUEST_TIMEOUT = 20.0  # seconds per API call; budgets below keep replies short
+    MAX_RETRIES = 3  # SDK-level retries on connection errors, 429 and 5xx
+
+    # Generation budget per text: ~4 source chars per token, times how much the target
+    # language expands relative to English (unlisted languages use the default)
+    CHARS_PER_TOKEN = 4
+    OUTPUT_TOKEN_FACTORS = {"ar": 1.2, "zh": 0.7, "ja": 0.7, "ko": 0.7}
+    DEFAULT_OUTPUT_TOKEN_FACTOR = 1.3
+    MIN_MAX_TOKENS = 32
+    MAX_MAX_TOKENS = 4000
+
+    # enqueue(): a queued batch is sent once it holds this many characters, or once the
+    # oldest request has waited this long
+    ENQUEUE_MAX_BATCH_CHARS = 6000
+    ENQUEUE_MAX_WAIT = 0.05  # seconds
+
+    # route_short_texts: labels up to this long, without placeholders or context, are tried
+    # on the smaller, faster model first
+    FAST_MODEL = "llama-3.1-8b-instant"
+    SHORT_TEXT_MAX_CHARS = 40
+
+    # translate() splits longer texts at sentence ends and translates the pieces separately
+    LONG_TEXT_CHARS = 2000
+
+    SLOW_MODE_INTERVAL = 0.5  # seconds between request starts in slow mode
+
+    # Groq free-tier request and token limits, applied per model in slow mode
+    MODEL_REQUESTS_PER_MINUTE = {
+        "llama-3.3-70b-versatile": 30,
+        "llama-3.1-8b-instant": 30,
+    }
+    MODEL_TOKENS_PER_MINUTE = {
+        "llama-3.3-70b-versatile": 12000,
+        "llama-3.1-8b-instant": 6000,
+    }
+
+    # Adaptive batching: grow after fast successful batches, halve after failed ones
+    MIN_BATCH_SIZE = 10
+    MAX_BATCH_SIZE = 50
+    BATCH_LATENCY_TARGET = 8.0  # seconds; slower batched calls stop the growth
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         slow_mode: bool = False,
         output: Optional[OutputFilter] = None,
+        cache_size: int = 4096,
+        concurrency: Optional[int] = None,
+        disk_cache: Optional[TranslationCache] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        route_short_texts: bool = False,
     ):
         """
         Initialize translator.
@@ -30,19 +289,34 @@ class Translator:
             api_key: Groq API key (or from GROQ_API_KEY env var)
             slow_mode: Enable slow mode (rate limiting)
             output: Output filter instance
+            cache_size: Max successful translations kept in memory (0 disables the cache)
+            concurrency: Batches sent in parallel by translate_batch (default 4, 1 in slow mode)
+            disk_cache: Persistent cache consulted on in-memory misses, for reuse across runs
+            requests_per_minute: Per-model request limit; defaults to the free-tier limits
+                in slow mode and to no limit otherwise
+            tokens_per_minute: Per-model limit on prompt plus max_tokens, with the same defaults
+            route_short_texts: Send short plain texts to FAST_MODEL first in translate()
         """
         self.output = output or OutputFilter()
         self.slow_mode = slow_mode
+        if concurrency is None:
+            concurrency = 1 if slow_mode else 4
+        self.concurrency = max(1, concurrency)
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("GROQ_API_KEY environment variable is required")
 
-        if Groq is None:
+        groq = _load_groq()
+        if groq is None:
             raise ImportError(
                 "Missing dependency 'groq'. Install it (e.g. `pip install groq`) or reinstall ai-translate with its dependencies."
             )
 
-        self.client = Groq(api_key=self.api_key)
+        client_kwargs: Dict[str, Any] = {"timeout": self.REQUEST_TIMEOUT, "max_retries": self.MAX_RETRIES}
+        http_client = _build_http_client(max_connections=max(8, self.concurrency * 2))
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self.client = groq.Groq(api_key=self.api_key, **client_kwargs)
         self.policy = PolicyEngine()
         # Use a supported model (llama-3.1-70b-versatile was decommissioned)
         # Try models in order of preference
@@ -51,12 +325,51 @@ class Translator:
             "llama-3.1-8b-instant",     # Fast alternative
         ]
         self.current_model_index = 0
+        self.route_short_texts = route_short_texts and self.FAST_MODEL in self.models
+        # Proactive throttling: wait for a token instead of provoking 429s and retries
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        # Slow mode also spaces out request starts (across all models); a one-token bucket
+        # only waits for whatever part of the interval the previous call didn't already use
+        self._slow_mode_pacer: Optional[TokenBucket] = None
+        if slow_mode:
+            self._slow_mode_pacer = TokenBucket(rate=1.0 / self.SLOW_MODE_INTERVAL, capacity=1)
+        self._token_limiters: Dict[str, TokenBucket] = {}
+        for model in self.models:
+            rpm, tpm = requests_per_minute, tokens_per_minute
+            if slow_mode:
+                rpm = rpm or self.MODEL_REQUESTS_PER_MINUTE.get(model)
+                tpm = tpm or self.MODEL_TOKENS_PER_MINUTE.get(model)
+            if rpm:
+                self._rate_limiters[model] = TokenBucket.per_minute(rpm)
+            if tpm:
+                self._token_limiters[model] = TokenBucket.per_minute(tpm)
         self.disabled_models: set[str] = set()
+        # Cleared when the Batch API turns out to be unavailable; translate_bulk then
+        # goes straight to translate_batch
+        self.bulk_api_available = True
+        # Last reported failure, so repeats of the same error are shown only once
+        self._last_error: Optional[str] = None
+        # Batch size actually used by translate_batch; seeded from the first call's batch_size
+        self.effective_batch_size: Optional[int] = None
+        self.batch_latency_ema: Optional[float] = None  # seconds per batched call
+        # In-process LRU of successful translations: (source_lang, target_lang, context, text) -> text
+        self.cache_size = cache_size
+        self.disk_cache = disk_cache
+        self._response_cache: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # enqueue() requests, drained by a background thread started on first use
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._queue_worker: Optional[threading.Thread] = None
+        self._queue_lock = threading.Lock()
+        # Batches may run on worker threads; counters are updated under this lock
+        self._stats_lock = threading.Lock()
         self.stats = {
             "translated": 0,
             "failed": 0,
             "skipped": 0,
             "rejected": 0,
+            "cached": 0,
+            "routed": 0,  # translated by FAST_MODEL through route_short_texts
         }
 
     def _model_trial_indices(self) -> list[int]:
@@ -66,6 +379,111 @@ class Translator:
         start = min(max(self.current_model_index, 0), len(self.models) - 1)
         return list(range(start, len(self.models))) + list(range(0, start))
 
+    def _is_simple_text(self, text: str, context: Optional[str]) -> bool:
+        """Whether a text is a short, placeholder-free label with no extra context."""
+        return (
+            context is None
+            and len(text) <= self.SHORT_TEXT_MAX_CHARS
+            and "{" not in text
+            and "%" not in text
+        )
+
+    def _estimate_max_tokens(self, text: str, target_lang: str) -> int:
+        """
+        Generation budget for translating `text` into `target_lang`.
+
+        Sized from the source length so short labels don't reserve a large budget and
+        long texts aren't cut off. Doubled for tokenizer variance, then clamped.
+        """
+        factor = self.OUTPUT_TOKEN_FACTORS.get(target_lang, self.DEFAULT_OUTPUT_TOKEN_FACTOR)
+        estimate = int(len(text) / self.CHARS_PER_TOKEN * factor * 2)
+        return max(self.MIN_MAX_TOKENS, min(self.MAX_MAX_TOKENS, estimate))
+
+    def _create_completion(
+        self,
+        model: str,
+        system_message: Dict[str, str],
+        prompt: str,
+        max_tokens: int,
+        throttle: bool = True,
+    ):
+        """Single chat-completion request, throttled by the model's rate limiters if any."""
+        if throttle:
+            self._throttle(model, system_message, prompt, max_tokens)
+        return self.client.chat.completions.create(
+            model=model,
+            messages=[
+                system_message,
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.2,  # Lower temperature for more consistent output
+            max_tokens=max_tokens,
+        )
+
+    def _throttle(
+        self, model: str, system_message: Dict[str, str], prompt: str, max_tokens: int
+    ):
+        """Wait for the slow-mode pacer and the model's request/token buckets, if any."""
+        if self._slow_mode_pacer is not None:
+            self._slow_mode_pacer.acquire()
+        limiter = self._rate_limiters.get(model)
+        if limiter is not None:
+            limiter.acquire()
+        token_limiter = self._token_limiters.get(model)
+        if token_limiter is not None:
+            # Groq counts the prompt plus the requested generation budget against the limit;
+            # a request larger than a whole minute's budget waits for a full bucket
+            prompt_chars = len(system_message["content"]) + len(prompt)
+            tokens = prompt_chars // self.CHARS_PER_TOKEN + max_tokens
+            token_limiter.acquire(min(tokens, token_limiter.capacity))
+
+    def _count(self, key: str, n: int = 1):
+        """Increment a stats counter (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += n
+
+    def _count_many(self, **counts: int):
+        """Increment several stats counters under one lock acquisition."""
+        with self._stats_lock:
+            for key, n in counts.items():
+                if n:
+                    self.stats[key] += n
+
+    @staticmethod
+    def _disk_key(key: Tuple[str, str, str, str]) -> str:
+        """Persistent cache key for (source_lang, target_lang, context, text)."""
+        return "translation:" + "\x1f".join(key)
+
+    def _cache_get(self, key: Tuple[str, str, str, str]) -> Optional[str]:
+        """Return a cached translation (memory first, then disk) or None."""
+        with self._cache_lock:
+            translated = self._response_cache.get(key)
+            if translated is not None:
+                self._response_cache.move_to_end(key)
+                return translated
+        if self.disk_cache is None:
+            return None
+        translated = self.disk_cache.get(self._disk_key(key))
+        if not isinstance(translated, str) or not translated:
+            return None
+        self._cache_put(key, translated, persist=False)
+        return translated
+
+    def _cache_put(self, key: Tuple[str, str, str, str], translated: str, persist: bool = True):
+        """Remember a successful translation, evicting the least recently used beyond cache_size."""
+        if not translated:
+            return
+        if persist and self.disk_cache is not None:
+            self.disk_cache.set(self._disk_key(key), translated)
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            cache = self._response_cache
+            cache[key] = translated
+            cache.move_to_end(key)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
     def translate(
         self,
         text: str,
@@ -87,122 +505,181 @@ class Translator:
             Status: "ok", "failed", "skipped", "rejected"
         """
         # Check policy first
-        from ai_translate.policy import TranslationContext
-
-        # Create minimal context for policy check
-        policy_context = TranslationContext(layer="A")
-        decision, reason = self.policy.decide(text, policy_context)
+        decision, reason = self.policy.decide(text, _POLICY_CTX_A)
 
         if decision.value == "skip":
-            self.stats["skipped"] += 1
+            self._count("skipped")
             return None, "skipped"
         elif decision.value == "keep_original":
-            self.stats["skipped"] += 1
+            self._count("skipped")
             return text, "skipped"
 
+        return self._translate_text(text, target_lang, source_lang, context)
+
+    def _translate_text(
+        self,
+        text: str,
+        target_lang: str,
+        source_lang: str,
+        context: Optional[str],
+    ) -> Tuple[Optional[str], str]:
+        """Translate a text that passed the policy check (cache, long-text split, models)."""
+        cache_key = (source_lang, target_lang, context or "", text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._count("translated")
+            self._count("cached")
+            return cached, "ok"
+
+        if len(text) > self.LONG_TEXT_CHARS:
+            pieces = _split_long_text(text, self.LONG_TEXT_CHARS)
+            if len(pieces) > 1:
+                return self._translate_pieces(pieces, cache_key, target_lang, source_lang, context)
+
         # Mask placeholders before sending to the model (legacy script behavior)
         masked_text, placeholder_map = self._mask_placeholders(text)
         prompt = self._build_prompt(masked_text, target_lang, source_lang, context)
 
-        # Try models in order until one works
+        # Try models in order until one works. Optionally, short plain labels go to the fast
+        # model first; if its reply is rejected, the remaining models get a chance.
+        trial_indices = self._model_trial_indices()
+        routed = self.route_short_texts and self._is_simple_text(text, context)
+        if routed:
+            fast_index = self.models.index(self.FAST_MODEL)
+            trial_indices = [fast_index] + [i for i in trial_indices if i != fast_index]
         last_error = None
-        for model_index in self._model_trial_indices():
+        for model_index in trial_indices:
             model = self.models[model_index]
             if model in self.disabled_models:
                 continue
             try:
                 # Call Groq API
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a professional translator. Return ONLY the translated text, nothing else. Preserve all placeholders exactly.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.2,  # Lower temperature for more consistent output
-                    max_tokens=500,  # Reduce max tokens to prevent verbose responses
+                response = self._create_completion(
+                    model,
+                    _SINGLE_SYSTEM_MESSAGE,
+                    prompt,
+                    max_tokens=self._estimate_max_tokens(masked_text, target_lang),
                 )
 
-                translated = response.choices[0].message.content.strip()
-                
-                # Clean up: Remove any instruction text that might have been included
-                # Look for common patterns where the model includes instructions
-                lines = translated.split('\n')
-                cleaned_lines = []
-                for line in lines:
-                    line = line.strip()
-                    # Skip lines that look like instructions
-                    if any(keyword in line.lower() for keyword in ['important:', 'rules:', 'preserve', 'do not', 'return', 'translation:', 'نص', 'مهم', 'احفظ', 'لا تترجم']):
-                        # Check if this line contains actual translation content
-                        if not any(keyword in line.lower() for keyword in ['translate', 'ترجمة', 'translation']):
-                            continue
-                    # Skip empty lines at the start
-                    if not cleaned_lines and not line:
+                translated, status = self._finalize_single(
+                    text, response.choices[0].message.content, placeholder_map, target_lang
+                )
+                if status != "ok" or translated is None:
+                    if routed and model == self.FAST_MODEL:
                         continue
-                    cleaned_lines.append(line)
-                
-                # Join and clean
-                translated = '\n'.join(cleaned_lines).strip()
-                
-                # If translation still contains instruction-like text, try to extract just the translation part
-                if 'translation:' in translated.lower() or 'ترجمة' in translated.lower():
-                    # Try to find the actual translation after "Translation:" or similar
-                    parts = translated.split(':', 1)
-                    if len(parts) > 1:
-                        translated = parts[1].strip()
-                
-                # Final cleanup: remove any remaining instruction markers
-                translated = translated.replace('Translation:', '').replace('ترجمة:', '').strip()
-
-                # Restore placeholders
-                translated = self._restore_placeholders(translated, placeholder_map)
-                # If any placeholder tokens remain, reject
-                if "__PH_" in translated:
-                    self.stats["rejected"] += 1
-                    return None, "rejected"
-
-                # Guardrail: reject obviously wrong-language outputs (e.g., Chinese when target is Arabic)
-                if self._fails_language_guard(translated, target_lang):
-                    self.stats["rejected"] += 1
-                    return None, "rejected"
-
-                # Validate placeholders
-                if not self.policy.validate_placeholders(text, translated):
-                    self.stats["rejected"] += 1
-                    # Don't show warnings during translation to avoid cluttering progress bar
-                    # Warnings will be shown in summary if needed
-                    return None, "rejected"
-
-                # Success - update model index for future calls
-                self.current_model_index = model_index
-                self.stats["translated"] += 1
+                    self._count("rejected")
+                    return None, status
+
+                if routed and model == self.FAST_MODEL:
+                    self._count("routed")
+                else:
+                    # Success - update model index for future calls
+                    self.current_model_index = model_index
+                self._count("translated")
+                self._cache_put(cache_key, translated)
                 return translated, "ok"
 
             except Exception as e:
                 last_error = e
-                error_str = str(e)
-                
-                # Check if model is decommissioned or invalid
-                if "decommissioned" in error_str.lower() or "invalid" in error_str.lower() or "not found" in error_str.lower():
+                # Model decommissioned or unknown: stop offering it
+                if _is_model_unavailable(e):
                     self.disabled_models.add(model)
                     self.output.warning(f"Model {model} not available, trying next model...", verbose_only=True)
                     continue
                 
-                # Different error: try next model
+                # Other errors (the client has already retried transient ones): try next model
                 self.output.warning(f"Error with model {model}, trying next model...", verbose_only=True)
                 continue
         
         # All models failed
-        self.stats["failed"] += 1
+        self._count("failed")
         error_msg = str(last_error) if last_error else "Unknown error"
         # Only show error once per unique error message to avoid spam
-        if not hasattr(self, '_last_error') or self._last_error != error_msg:
+        if self._last_error != error_msg:
             self.output.error(f"Translation failed: {error_msg}")
             self._last_error = error_msg
         return None, "failed"
 
+    def _translate_pieces(
+        self,
+        pieces: List[str],
+        cache_key: Tuple[str, str, str, str],
+        target_lang: str,
+        source_lang: str,
+        context: Optional[str],
+    ) -> Tuple[Optional[str], str]:
+        """
+        Translate the pieces of a long text (concurrently when allowed) and join them.
+
+        The policy already accepted the whole text, so pieces skip it and go straight to
+        the cache and models. Stats count pieces and pieces are cached individually; the
+        joined result is cached under the whole text only when every piece translated.
+        """
+        cores = [piece.strip() for piece in pieces]
+
+        def translate_piece(core: str) -> Tuple[Optional[str], str]:
+            return self._translate_text(core, target_lang, source_lang, context)
+
+        if self.concurrency > 1:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(cores))) as pool:
+                piece_results = list(pool.map(translate_piece, cores))
+        else:
+            piece_results = [translate_piece(core) for core in cores]
+
+        parts: List[str] = []
+        for piece, core, (translated, status) in zip(pieces, cores, piece_results):
+            if status != "ok" or translated is None:
+                return None, status
+            # Keep the original whitespace around each piece (the separators between them)
+            lead = piece[: len(piece) - len(piece.lstrip())]
+            trail = piece[len(piece.rstrip()) :]
+            parts.append(f"{lead}{translated}{trail}")
+        joined = "".join(parts)
+        self._cache_put(cache_key, joined)
+        return joined, "ok"
+
+    def _finalize_single(
+        self,
+        text: str,
+        raw: Optional[str],
+        placeholder_map: PlaceholderMap,
+        target_lang: str,
+    ) -> Tuple[Optional[str], str]:
+        """
+        Turn a raw single-text model reply into a final translation.
+
+        Strips instruction echoes, restores placeholders and applies the guards.
+        Returns (translated, "ok") or (None, "rejected"); callers count the outcome.
+        """
+        # Guardrail on the raw reply first: a wrong-language answer (e.g., Chinese when the
+        # target is Arabic) is rejected before any cleanup/restoration work.
+        raw = raw or ""
+        if self._fails_language_guard(raw, target_lang):
+            return None, "rejected"
+
+        translated = _clean_translation(raw)
+        # Nothing left once instruction echoes are stripped: not a translation
+        if not translated:
+            return None, "rejected"
+
+        # Restore placeholders
+        translated = self._restore_placeholders(translated, placeholder_map)
+        # If any placeholder tokens remain, reject
+        if "__PH_" in translated:
+            return None, "rejected"
+
+        # Re-check the final text: cleanup may have dropped Arabic instruction echoes, and
+        # restored placeholders add characters
+        if self._fails_language_guard(translated, target_lang):
+            return None, "rejected"
+
+        # Validate placeholders
+        if not self.policy.validate_placeholders(text, translated):
+            # Don't show warnings during translation to avoid cluttering progress bar
+            # Warnings will be shown in summary if needed
+            return None, "rejected"
+        return translated, "ok"
+
     def translate_batch(
         self,
         texts: List[str],
@@ -218,7 +695,7 @@ class Translator:
             texts: List of texts to translate
             target_lang: Target language code
             source_lang: Source language code
-            batch_size: Batch size for API calls (20-50 recommended)
+            batch_size: Initial batch size for API calls (10-50); tuned adaptively afterwards
             context: Optional context for translation
 
         Returns:
@@ -226,54 +703,378 @@ class Translator:
         """
         if not texts:
             return []
-        
-        # Clamp batch size to reasonable range
-        batch_size = max(10, min(50, batch_size))
-        
-        results = []
-        
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            
-            # Try batch translation first
-            batch_results = self._translate_batch_internal(batch, target_lang, source_lang, context)
-            
-            # If batch translation failed, fallback to individual
-            if batch_results is None:
-                # Fallback to individual translation
-                for text in batch:
-                    result = self.translate(text, target_lang, source_lang, context)
-                    results.append(result)
-                    
-                    # Rate limiting in slow mode
-                    if self.slow_mode:
-                        time.sleep(0.3)
+
+        # UI catalogs repeat strings a lot: translate each distinct text once and fan results out
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            unique_results = dict(
+                zip(
+                    unique_texts,
+                    self.translate_batch(
+                        unique_texts, target_lang, source_lang, batch_size, context
+                    ),
+                )
+            )
+            return [unique_results[text] for text in texts]
+
+        # The first call seeds the adaptive size (clamped to a reasonable range); later calls
+        # use what the observed batch latency and parse failures have tuned it to
+        if self.effective_batch_size is None:
+            self.effective_batch_size = max(
+                self.MIN_BATCH_SIZE, min(self.MAX_BATCH_SIZE, batch_size)
+            )
+        batch_size = self.effective_batch_size
+
+        if self.concurrency == 1 or len(texts) <= batch_size:
+            # Serial: every chunk picks up the size tuned by the previous one
+            results: List[Tuple[Optional[str], str]] = []
+            start = 0
+            while start < len(texts):
+                batch = texts[start : start + self.effective_batch_size]
+                results.extend(self._translate_chunk(batch, target_lang, source_lang, context))
+                start += len(batch)
+            return results
+
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        # API calls are I/O bound: keep several batches in flight, results stay in input order
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as pool:
+            chunk_results = pool.map(
+                lambda batch: self._translate_chunk(batch, target_lang, source_lang, context),
+                batches,
+            )
+            return [result for chunk in chunk_results for result in chunk]
+
+    def _tune_batch_size(self, succeeded: bool, elapsed: float):
+        """
+        Multiplicative-increase / halving control of effective_batch_size.
+
+        Larger batches amortize per-request overhead but take longer to first token and
+        fail to parse more often; a failed batch halves the size, a successful batch under
+        BATCH_LATENCY_TARGET grows it by 25%.
+        """
+        with self._stats_lock:
+            size = self.effective_batch_size or self.MAX_BATCH_SIZE
+            if succeeded:
+                ema = self.batch_latency_ema
+                ema = elapsed if ema is None else 0.8 * ema + 0.2 * elapsed
+                self.batch_latency_ema = ema
+                if ema <= self.BATCH_LATENCY_TARGET:
+                    size = min(self.MAX_BATCH_SIZE, int(size * 1.25))
             else:
-                results.extend(batch_results)
-                
-                # Rate limiting in slow mode
-                if self.slow_mode:
-                    time.sleep(0.5)
-        
-        return results
-    
+                size = max(self.MIN_BATCH_SIZE, size // 2)
+            self.effective_batch_size = size
+
+    def _translate_chunk(
+        self,
+        batch: List[str],
+        target_lang: str,
+        source_lang: str,
+        context: Optional[str],
+    ) -> List[Tuple[Optional[str], str]]:
+        """Translate one batch with a single API call, falling back to per-text calls."""
+        # Try batch translation first
+        batch_results, feedback = self._translate_batch_internal(
+            batch, target_lang, source_lang, context
+        )
+        # Only replies from the API say anything about the batch size; cache-only chunks
+        # and network/model errors leave it alone
+        if feedback is not None:
+            self._tune_batch_size(*feedback)
+        if batch_results is not None:
+            return batch_results
+
+        # Batch translation failed: fallback to individual translation
+        if self.concurrency > 1 and len(batch) > 1:
+            # Independent round trips: overlap them instead of paying one after another
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batch))) as pool:
+                return list(
+                    pool.map(
+                        lambda text: self.translate(text, target_lang, source_lang, context),
+                        batch,
+                    )
+                )
+
+        return [self.translate(text, target_lang, source_lang, context) for text in batch]
+
+    def translate_bulk(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: str = "en",
+        context: Optional[str] = None,
+        timeout: float = 24 * 3600.0,
+    ) -> List[Tuple[Optional[str], str]]:
+        """
+        Translate a large catalog through Groq's asynchronous Batch API.
+
+        Trades latency (the job may take minutes to hours) for throughput and cost. Below
+        BULK_MIN_TEXTS, or when the SDK or account has no batch support, this is
+        translate_batch().
+        Texts the job does not return, or returns as errors, are retried via translate_batch().
+
+        Args:
+            texts: List of texts to translate
+            target_lang: Target language code
+            source_lang: Source language code
+            context: Optional context for translation
+            timeout: Max seconds to wait for the batch job
+
+        Returns:
+            List of (translated_text, status) tuples
+        """
+        if (
+            len(texts) < self.BULK_MIN_TEXTS
+            or not self.bulk_api_available
+            or not hasattr(self.client, "batches")
+        ):
+            return self.translate_batch(texts, target_lang, source_lang, context=context)
+
+        models = [self.models[i] for i in self._model_trial_indices()]
+        model = next((m for m in models if m not in self.disabled_models), None)
+        if model is None:
+            return self.translate_batch(texts, target_lang, source_lang, context=context)
+
+        context_key = context or ""
+        results: Dict[str, Tuple[Optional[str], str]] = {}
+        pending: Dict[str, Tuple[str, PlaceholderMap]] = {}  # custom_id -> (text, placeholder map)
+        request_lines: List[str] = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache_get((source_lang, target_lang, context_key, text))
+            if cached is not None:
+                results[text] = (cached, "ok")
+                self._count("translated")
+                self._count("cached")
+                continue
+            masked_text, placeholder_map = self._mask_placeholders(text)
+            custom_id = str(len(pending))
+            pending[custom_id] = (text, placeholder_map)
+            request_lines.append(
+                json.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": model,
+                            "messages": [
+                                _SINGLE_SYSTEM_MESSAGE,
+                                {
+                                    "role": "user",
+                                    "content": self._build_prompt(
+                                        masked_text, target_lang, source_lang, context
+                                    ),
+                                },
+                            ],
+                            "temperature": 0.2,
+                            "max_tokens": self._estimate_max_tokens(masked_text, target_lang),
+                        },
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+        replies: Dict[str, str] = {}
+        if request_lines:
+            try:
+                replies = self._run_batch_job("\n".join(request_lines), timeout)
+            except Exception as e:
+                # Endpoint missing or not enabled for this account: don't upload again
+                if _is_groq_error(e, "NotFoundError", "PermissionDeniedError"):
+                    self.bulk_api_available = False
+                self.output.warning(
+                    f"Batch job failed: {e}, falling back to batched requests", verbose_only=True
+                )
+
+        leftovers: List[str] = []
+        for custom_id, (text, placeholder_map) in pending.items():
+            raw = replies.get(custom_id)
+            if raw is None:
+                leftovers.append(text)
+                continue
+            translated, status = self._finalize_single(text, raw, placeholder_map, target_lang)
+            if status == "ok" and translated is not None:
+                self._count("translated")
+                self._cache_put((source_lang, target_lang, context_key, text), translated)
+            else:
+                self._count("rejected")
+            results[text] = (translated, status)
+
+        if leftovers:
+            results.update(
+                zip(
+                    leftovers,
+                    self.translate_batch(leftovers, target_lang, source_lang, context=context),
+                )
+            )
+        return [results[text] for text in texts]
+
+    def _run_batch_job(self, requests_jsonl: str, timeout: float) -> Dict[str, str]:
+        """
+        Upload a JSONL request file, run it as a Batch API job and wait for it.
+
+        Returns custom_id -> reply content for the requests that succeeded (empty if the
+        job failed, expired or did not finish within timeout).
+        """
+        input_file = self.client.files.create(
+            file=("translations.jsonl", requests_jsonl.encode("utf-8")), purpose="batch"
+        )
+        job = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        deadline = time.monotonic() + timeout
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                self.client.batches.cancel(job.id)
+                return {}
+            time.sleep(self.BULK_POLL_INTERVAL)
+            job = self.client.batches.retrieve(job.id)
+        if job.status != "completed" or not job.output_file_id:
+            return {}
+
+        replies: Dict[str, str] = {}
+        content = self.client.files.content(job.output_file_id).read().decode("utf-8")
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            choices = (response.get("body") or {}).get("choices") or []
+            if choices:
+                replies[row["custom_id"]] = choices[0]["message"]["content"]
+        return replies
+
+    def enqueue(
+        self,
+        text: str,
+        target_lang: str,
+        source_lang: str = "en",
+        context: Optional[str] = None,
+    ) -> "Future[Tuple[Optional[str], str]]":
+        """
+        Queue a text for translation and return a Future of (translated_text, status).
+
+        A background thread packs requests arriving close together (up to
+        ENQUEUE_MAX_BATCH_CHARS, waiting at most ENQUEUE_MAX_WAIT) into batched API calls,
+        so many small callers share a few requests instead of one each.
+        """
+        future: "Future[Tuple[Optional[str], str]]" = Future()
+        with self._queue_lock:
+            if self._queue_worker is None:
+                self._queue_worker = threading.Thread(
+                    target=self._drain_queue, name="translator-queue", daemon=True
+                )
+                self._queue_worker.start()
+            self._queue.put((text, target_lang, source_lang, context, future))
+        return future
+
+    def _drain_queue(self):
+        """Background loop behind enqueue(): collect queued requests and translate in batches."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            pending = [item]
+            chars = len(item[0])
+            deadline = time.monotonic() + self.ENQUEUE_MAX_WAIT
+            stop = False
+            while chars < self.ENQUEUE_MAX_BATCH_CHARS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+                chars += len(item[0])
+            self._resolve_queued(pending)
+            if stop:
+                return
+
+    def _resolve_queued(self, pending: List[tuple]):
+        """Translate queued requests, one batch per (target, source, context), and settle futures."""
+        groups: Dict[Tuple[str, str, Optional[str]], List[tuple]] = {}
+        for item in pending:
+            groups.setdefault((item[1], item[2], item[3]), []).append(item)
+        for (target_lang, source_lang, context), items in groups.items():
+            try:
+                results = self.translate_batch(
+                    [item[0] for item in items], target_lang, source_lang, context=context
+                )
+            except Exception as e:
+                for item in items:
+                    item[4].set_exception(e)
+                continue
+            for item, result in zip(items, results):
+                item[4].set_result(result)
+
     def _translate_batch_internal(
         self,
         texts: List[str],
         target_lang: str,
         source_lang: str,
         context: Optional[str],
-    ) -> Optional[List[Tuple[Optional[str], str]]]:
+    ) -> Tuple[Optional[List[Tuple[Optional[str], str]]], BatchFeedback]:
         """
-        Internal batch translation using single API call.
-        
-        Returns None if batch translation fails (should fallback to individual).
+        Internal batch translation: serve cached texts, send only the misses in one API call.
+
+        Returns (results, feedback); results is None if batch translation fails (should
+        fallback to individual), feedback is _request_batch's (None if nothing was sent).
         """
+        context_key = context or ""
+        results: List[Optional[Tuple[Optional[str], str]]] = [None] * len(texts)
+        miss_indices: List[int] = []
+        for i, text in enumerate(texts):
+            cached = self._cache_get((source_lang, target_lang, context_key, text))
+            if cached is None:
+                miss_indices.append(i)
+            else:
+                results[i] = (cached, "ok")
+
+        if miss_indices:
+            misses = [texts[i] for i in miss_indices]
+            miss_results, feedback = self._request_batch(misses, target_lang, source_lang, context)
+            if miss_results is None:
+                # Individual fallback re-reads the hits from the cache (and counts them there)
+                return None, feedback
+            for i, text, result in zip(miss_indices, misses, miss_results):
+                results[i] = result
+                if result[1] == "ok" and result[0]:
+                    self._cache_put((source_lang, target_lang, context_key, text), result[0])
+        else:
+            feedback = None
+        hits = len(texts) - len(miss_indices)
+        self._count_many(translated=hits, cached=hits)
+        return results, feedback  # type: ignore[return-value]
+
+    def _request_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: str,
+        context: Optional[str],
+    ) -> Tuple[Optional[List[Tuple[Optional[str], str]]], BatchFeedback]:
+        """
+        Translate texts with a single API call.
+
+        Returns (results, feedback). results is None if batch translation fails (should
+        fallback to individual). feedback is (True, seconds) for a parsed reply, (False,
+        seconds) if a reply came back unparseable, and None if every call raised; seconds
+        cover the API call and parse, not rate-limiter waits.
+        """
+        feedback: BatchFeedback = None
         try:
             # Mask placeholders per-text before batching (legacy behavior)
             masked_texts: List[str] = []
-            placeholder_maps: List[Dict[str, str]] = []
+            placeholder_maps: List[PlaceholderMap] = []
             for t in texts:
                 mt, mp = self._mask_placeholders(t)
                 masked_texts.append(mt)
@@ -289,26 +1090,27 @@ class Translator:
                 if model in self.disabled_models:
                     continue
                 try:
+                    max_tokens = min(
+                        self.MAX_MAX_TOKENS,
+                        sum(self._estimate_max_tokens(t, target_lang) for t in masked_texts)
+                        + 64,  # JSON array brackets, quotes and commas
+                    )
+                    self._throttle(model, _BATCH_SYSTEM_MESSAGE, prompt, max_tokens)
+                    started = time.monotonic()
                     # Call Groq API
-                    response = self.client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a professional translator. Return translations in JSON format or newline-separated format. Preserve all placeholders exactly.",
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                        temperature=0.2,
-                        max_tokens=2000,  # More tokens for batch
+                    response = self._create_completion(
+                        model, _BATCH_SYSTEM_MESSAGE, prompt, max_tokens, throttle=False
                     )
                     
                     translated_text = response.choices[0].message.content.strip()
                     
                     # Parse batch response
                     parsed_results = self._parse_batch_response(translated_text, texts, target_lang)
+                    elapsed = time.monotonic() - started
                     
-                    if parsed_results:
+                    if not parsed_results:
+                        feedback = (False, elapsed)
+                    else:
                         # Restore placeholders per item
                         restored: List[Tuple[Optional[str], str]] = []
                         for i, (tr, st) in enumerate(parsed_results):
@@ -322,29 +1124,28 @@ class Translator:
                                 restored.append((tr, st))
                         # Success - update model index
                         self.current_model_index = model_index
-                        return restored
+                        # An earlier model's unparseable reply still counts against the size
+                        return restored, feedback or (True, elapsed)
                     
                 except Exception as e:
                     last_error = e
-                    error_str = str(e)
-                    
-                    # Check if model is decommissioned or invalid
-                    if "decommissioned" in error_str.lower() or "invalid" in error_str.lower() or "not found" in error_str.lower():
+                    # Model decommissioned or unknown: stop offering it
+                    if _is_model_unavailable(e):
                         self.disabled_models.add(model)
                         self.output.warning(f"Model {model} not available, trying next model...", verbose_only=True)
                         continue
                     
-                    # Different error: try next model
+                    # Other errors (the client has already retried transient ones): try next model
                     self.output.warning(f"Error with model {model}, trying next model...", verbose_only=True)
                     continue
             
             # All models failed
-            return None
+            return None, feedback
             
         except Exception as e:
             # Batch translation failed, return None to trigger fallback
             self.output.warning(f"Batch translation failed: {e}, falling back to individual translation", verbose_only=True)
-            return None
+            return None, feedback
 
     def _build_prompt(
         self,
@@ -354,52 +1155,51 @@ class Translator:
         context: Optional[str],
     ) -> str:
         """Build translation prompt for single text."""
-        # Build context-aware prompt
-        context_part = ""
-        if context:
-            context_part = f"\nContext: This text is from a {context}. Translate according to the meaning and context, not literally."
-        
-        prompt = f"""Translate the following text from {source_lang} to {target_lang}.{context_part}
+        # Rules are in _SINGLE_SYSTEM_PROMPT; only the text varies within a run
+        prefix = _single_prompt_prefix(source_lang, target_lang, context)
+        return f"{prefix}\n\nText: {text}\n\nTranslation:"
 
-Rules:
-- Preserve ALL placeholders exactly as they appear (e.g., {{0}}, {{1}}, %(name)s, {{{{ var }}}})
-- Keep the same formatting and structure
-- Do NOT translate technical terms, code, URLs, or email addresses
-- Translate according to meaning and context, not word-by-word
-- Return ONLY the translated text, no explanations, no instructions, no additional text
-
-Text: {text}
-
-Translation:"""
-        return prompt
-
-    def _mask_placeholders(self, text: str) -> Tuple[str, Dict[str, str]]:
+    def _mask_placeholders(self, text: str) -> Tuple[str, PlaceholderMap]:
         """
         Replace placeholders with stable tokens to reduce model corruption.
         Covers: {..}, %(name)s, %s/%d, {{ var }}.
         """
         s = text or ""
-        placeholder_map: Dict[str, str] = {}
-        patterns = [
-            (r"\{\{[^}]+\}\}", "PH_JINJA"),
-            (r"%\([^)]+\)s", "PH_PERCENT_NAMED"),
-            (r"%[sd]", "PH_PERCENT_SIMPLE"),
-            (r"(?<!\{)\{[^{}]*\}(?!\})", "PH_BRACE"),
-        ]
-        c = 0
-        for pattern, prefix in patterns:
-            for m in list(re.finditer(pattern, s))[::-1]:
-                token = f"__{prefix}_{c}__"
-                placeholder_map[token] = m.group(0)
-                s = s[: m.start()] + token + s[m.end() :]
-                c += 1
-        return s, placeholder_map
-
-    def _restore_placeholders(self, text: str, placeholder_map: Dict[str, str]) -> str:
-        out = text or ""
-        for token, value in placeholder_map.items():
-            out = out.replace(token, value)
-        return out
+        # Every placeholder kind starts with "{" or "%"; most UI strings have neither
+        if "{" not in s and "%" not in s:
+            return s, _NO_PLACEHOLDERS
+        tokens: List[str] = []
+        values: List[str] = []
+        # Single forward pass; the group name is the token prefix
+        parts: List[str] = []
+        last = 0
+        for c, m in enumerate(_PLACEHOLDER_RE.finditer(s)):
+            token = f"__{m.lastgroup}_{c}__"
+            tokens.append(token)
+            values.append(m.group(0))
+            parts.append(s[last : m.start()])
+            parts.append(token)
+            last = m.end()
+        if not tokens:
+            return s, _NO_PLACEHOLDERS
+        parts.append(s[last:])
+        return "".join(parts), (tokens, values)
+
+    def _restore_placeholders(self, text: str, placeholder_map: PlaceholderMap) -> str:
+        tokens, values = placeholder_map
+        if not tokens:
+            return text or ""
+
+        def restore(m: "re.Match[str]") -> str:
+            # The token's number indexes the parallel lists; unknown (model-mangled) tokens
+            # are left in place for the caller to reject
+            i = int(m.group(1))
+            if i < len(tokens) and tokens[i] == m.group(0):
+                return values[i]
+            return m.group(0)
+
+        # One pass over the text
+        return _PLACEHOLDER_TOKEN_RE.sub(restore, text or "")
 
     def _fails_language_guard(self, translated: str, target_lang: str) -> bool:
         """
@@ -410,13 +1210,12 @@ Translation:"""
         if lang != "ar":
             return False
 
-        # Arabic blocks + extended Arabic
-        arabic_chars = len(re.findall(r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]", translated))
-        # CJK Unified + Extensions + Hiragana/Katakana (common Chinese/Japanese outputs)
-        cjk_chars = len(re.findall(r"[\u4E00-\u9FFF\u3400-\u4DBF\u3040-\u30FF]", translated))
-
         # If it contains CJK and essentially no Arabic, it's wrong for --lang ar.
-        return cjk_chars > 0 and arabic_chars == 0
+        # search() stops at the first hit, so the usual (no CJK) case is a single scan.
+        return (
+            _CJK_CHAR_RE.search(translated) is not None
+            and _ARABIC_CHAR_RE.search(translated) is None
+        )
     
     def _build_batch_prompt(
         self,
@@ -426,32 +1225,16 @@ Translation:"""
         context: Optional[str],
     ) -> str:
         """Build batch translation prompt."""
-        # Build context-aware prompt
-        context_part = ""
-        if context:
-            context_part = f"\nContext: These texts are from a {context}. Translate according to the meaning and context, not literally."
-        
+        # Rules are in _BATCH_SYSTEM_PROMPT. Assemble header, numbered texts and footer as one
+        # list joined once, instead of joining the texts and then copying them into an f-string.
+        parts = [
+            f"Translate the following {len(texts)} texts",
+            _batch_prompt_header(source_lang, target_lang, context),
+        ]
         # Number each text for reference
-        numbered_texts = []
-        for i, text in enumerate(texts, 1):
-            numbered_texts.append(f"{i}. {text}")
-        
-        texts_block = "\n".join(numbered_texts)
-        
-        prompt = f"""Translate the following {len(texts)} texts from {source_lang} to {target_lang}.{context_part}
-
-Rules:
-- Preserve ALL placeholders exactly as they appear (e.g., {{0}}, {{1}}, %(name)s, {{{{ var }}}})
-- Keep the same formatting and structure
-- Do NOT translate technical terms, code, URLs, or email addresses
-- Translate according to meaning and context, not word-by-word
-- Return translations in the same order, one per line, or as JSON array
-
-Texts:
-{texts_block}
-
-Translations (one per line or JSON array):"""
-        return prompt
+        parts.extend(f"{i}. {text}\n" for i, text in enumerate(texts, 1))
+        parts.append("\nTranslations (one per line or JSON array):")
+        return "".join(parts)
     
     def _parse_batch_response(
         self,
@@ -469,70 +1252,101 @@ Translations (one per line or JSON array):"""
         """
         if not response:
             return None
-        
-        results = []
-        
+
+        candidates: Optional[list] = None
         # Try JSON format first
-        import json
         try:
             # Try to parse as JSON
-            if response.strip().startswith('['):
-                parsed = json.loads(response)
+            if _JSON_ARRAY_START_RE.match(response):
+                parsed = _json_loads(response)
+                if isinstance(parsed, list) and len(parsed) != len(original_texts):
+                    # Extra or missing entries: realign by their "N. " prefixes if they have them
+                    parsed = self._align_numbered_items(parsed, len(original_texts))
                 if isinstance(parsed, list) and len(parsed) == len(original_texts):
-                    for i, trans in enumerate(parsed):
-                        if isinstance(trans, str):
-                            trans = trans.strip()
-                            # Guardrail: wrong-language outputs (e.g., CJK when target is Arabic)
-                            if self._fails_language_guard(trans, target_lang):
-                                results.append((None, "rejected"))
-                                self.stats["rejected"] += 1
-                            # Validate placeholders (also blocks introducing new { } fields)
-                            elif self.policy.validate_placeholders(original_texts[i], trans):
-                                results.append((trans, "ok"))
-                                self.stats["translated"] += 1
-                            else:
-                                results.append((None, "rejected"))
-                                self.stats["rejected"] += 1
-                        else:
-                            results.append((None, "failed"))
-                            self.stats["failed"] += 1
-                    return results
-        except (json.JSONDecodeError, ValueError):
+                    candidates = parsed
+        except ValueError:  # json/orjson decode errors both subclass ValueError
             pass
-        
-        # Try newline-separated format
-        lines = [line.strip() for line in response.split('\n') if line.strip()]
-        
-        # Filter out instruction lines
-        filtered_lines = []
-        for line in lines:
-            # Skip lines that look like instructions
-            if any(keyword in line.lower() for keyword in ['important:', 'rules:', 'preserve', 'do not', 'return', 'translation:', 'translations:']):
-                continue
-            # Skip numbered prefixes if present
-            if line and line[0].isdigit() and '. ' in line[:5]:
-                line = line.split('. ', 1)[1] if '. ' in line else line
-            filtered_lines.append(line)
-        
-        # Match lines to original texts
-        if len(filtered_lines) >= len(original_texts):
+
+        if candidates is None:
+            # Try newline-separated format (single pass: strip, drop blanks and instruction lines)
+            filtered_lines = []
+            for line in response.splitlines():
+                line = line.strip()
+                # Skip blank lines and lines that look like instructions
+                if not line or _BATCH_INSTRUCTION_LINE_RE.search(line):
+                    continue
+                # Skip numbered prefixes if present
+                m = _NUMBERED_LINE_RE.match(line)
+                filtered_lines.append(m.group(2) if m else line)
+
+            # If we don't have enough translations, return None to trigger fallback
+            if len(filtered_lines) < len(original_texts):
+                return None
             # Take first N lines
-            for i, trans in enumerate(filtered_lines[:len(original_texts)]):
-                # Guardrail: wrong-language outputs
-                if self._fails_language_guard(trans, target_lang):
-                    results.append((None, "rejected"))
-                    self.stats["rejected"] += 1
-                # Validate placeholders (also blocks introducing new { } fields)
-                elif self.policy.validate_placeholders(original_texts[i], trans):
-                    results.append((trans, "ok"))
-                    self.stats["translated"] += 1
-                else:
-                    results.append((None, "rejected"))
-                    self.stats["rejected"] += 1
-            return results
-        
-        # If we don't have enough translations, return None to trigger fallback
-        return None
+            candidates = filtered_lines[: len(original_texts)]
+
+        translations = [t.strip() if isinstance(t, str) else None for t in candidates]
+        # Validate placeholders for the whole batch in one call (also blocks introducing
+        # new { } fields); non-string items are failures either way
+        valid = self.policy.validate_placeholders_batch(
+            original_texts, [t or "" for t in translations]
+        )
+
+        # Tally locally and update the shared stats once per batch
+        results: List[Tuple[Optional[str], str]] = []
+        translated_n = rejected_n = failed_n = 0
+        for trans, placeholders_ok in zip(translations, valid):
+            if trans is None:
+                results.append((None, "failed"))
+                failed_n += 1
+            # Guardrail: wrong-language outputs (e.g., CJK when target is Arabic)
+            elif not placeholders_ok or self._fails_language_guard(trans, target_lang):
+                results.append((None, "rejected"))
+                rejected_n += 1
+            else:
+                results.append((trans, "ok"))
+                translated_n += 1
+        self._count_many(translated=translated_n, rejected=rejected_n, failed=failed_n)
+        return results
+
+    @staticmethod
+    def _align_numbered_items(items: list, count: int) -> Optional[List[str]]:
+        """
+        Order numbered reply items ("1. ...", "2. ...") by their numbers.
+
+        Unnumbered items (headings, notes) are skipped. Returns the `count` texts without
+        prefixes, or None unless the numbers are exactly 1..count.
+        """
+        aligned: List[Optional[str]] = [None] * count
+        for item in items:
+            m = _NUMBERED_LINE_RE.match(item.strip()) if isinstance(item, str) else None
+            if m is None:
+                continue
+            index = int(m.group(1)) - 1
+            if not 0 <= index < count or aligned[index] is not None:
+                return None
+            aligned[index] = m.group(2)
+        if any(text is None for text in aligned):
+            return None
+        return aligned  # type: ignore[return-value]
+
+    def close(self):
+        """Close the pooled HTTP connections (the translator must not be used afterwards)."""
+        # Let the enqueue() worker finish what is already queued first
+        with self._queue_lock:
+            worker, self._queue_worker = self._queue_worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def get_stats(self) -> dict:
         """Get translation statistics."""
@@ -545,5 +1359,7 @@ Translations (one per line or JSON array):"""
             "failed": 0,
             "skipped": 0,
             "rejected": 0,
+            "cached": 0,
+            "routed": 0,  # translated by FAST_MODEL through route_short_texts
         }
 
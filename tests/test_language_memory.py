@@ -11,6 +11,7 @@ from ai_translate.language_memory import (
     LanguageMemoryManager,
 )
 from ai_translate.policy import TranslationContext
+from ai_translate.translation_contract import TranslationContract
 from ai_translate.storage import TranslationEntry
 
 
@@ -89,3 +90,17 @@ class TestLanguageMemoryManager:
             memory2 = manager.get_memory("ar")
             assert len(memory2.accepted_translations) == 1
 
+
+class TestTranslationContract:
+    """Test TranslationContract."""
+
+    def test_terminology_matches_follow_memory_updates(self):
+        """Test memoized term matches are refreshed when terminology is added."""
+        memory = LanguageMemory(lang="ar", terminology={}, style_profile={}, accepted_translations=[])
+        contract = TranslationContract(memory)
+        assert contract.check_terminology("Open the Invoice.") == {}
+
+        memory.add_terminology("Invoice", "فاتورة")
+        assert contract.check_terminology("Open the Invoice.") == {"Invoice": "فاتورة"}
+        assert contract.validate_consistency("Open the Invoice.", "افتح المستند")[0] is False
+        assert contract.validate_consistency("Open the Invoice.", "افتح فاتورة")[0] is True
@@ -2,7 +2,14 @@
 
 import pytest
 
-from ai_translate.policy import Decision, PolicyEngine, RejectionReason, TranslationContext
+from ai_translate.policy import (
+    Decision,
+    Layer,
+    PolicyEngine,
+    RejectionReason,
+    TranslationContext,
+    context_key,
+)
 
 
 class TestPolicyEngine:
@@ -57,6 +64,20 @@ class TestPolicyEngine:
         assert not engine.validate_placeholders("Hello {0}", "مرحبا {1}")
         # Valid: no placeholders
         assert engine.validate_placeholders("Hello", "مرحبا")
+        # Invalid: a placeholder introduced into plain text
+        assert not engine.validate_placeholders("Hello", "مرحبا {0}")
+
+    def test_placeholder_validation_batch(self):
+        """Test batch placeholder validation matches per-pair validation."""
+        engine = PolicyEngine()
+        originals = ["Hello {0}", "Hello {0}", "Save", "%(count)s items"]
+        translations = ["مرحبا {0}", "مرحبا", "حفظ", "%(count)s عناصر"]
+        assert engine.validate_placeholders_batch(originals, translations) == [
+            True,
+            False,
+            True,
+            True,
+        ]
     
     def test_sql_keywords(self):
         """Test SQL keywords are kept original."""
@@ -66,3 +87,42 @@ class TestPolicyEngine:
         assert decision == Decision.KEEP_ORIGINAL
         assert reason == RejectionReason.LOGIC_BEARING
 
+
+    def test_tab_separated_words_look_translatable(self):
+        """Test words separated by tabs/newlines count as multiple words."""
+        engine = PolicyEngine()
+        assert engine._looks_translatable("Hello\tWorld")
+        assert engine._looks_translatable("Hello\nWorld")
+        assert not engine._looks_translatable("Hello")
+
+    def test_layer_normalized_to_enum(self):
+        """Test layer strings are normalized to Layer members."""
+        context = TranslationContext(layer="b")
+        assert context.layer is Layer.B
+        assert context.layer == "B"
+        assert f"{context.layer}" == "B"
+        with pytest.raises(ValueError):
+            TranslationContext(layer="Z")
+
+    def test_context_is_frozen_and_hashable(self):
+        """Test TranslationContext is immutable and usable as a dict key."""
+        context = TranslationContext(layer="A", app="test")
+        assert hash(context) == hash(TranslationContext(layer="a", app="test"))
+        with pytest.raises(AttributeError):
+            context.app = "other"
+
+    def test_decide_batch_matches_decide(self):
+        """Test decide_batch gives the same results and stats as decide."""
+        texts = ["", "123", "Hello World", "https://example.com", "Hello World"]
+        context = TranslationContext(layer="A")
+        single = PolicyEngine()
+        expected = [single.decide(t, context) for t in texts]
+        batch = PolicyEngine()
+        assert batch.decide_batch(texts, context) == expected
+        assert batch.get_stats() == single.get_stats()
+        assert batch.get_rejection_stats() == single.get_rejection_stats()
+
+    def test_context_key(self):
+        """Test context_key joins layer/app/doctype/fieldname with empty placeholders."""
+        assert context_key(TranslationContext(layer="b", app="erp", fieldname="label")) == "B|erp||label"
+        assert context_key(TranslationContext(layer="A")) == "A|||"
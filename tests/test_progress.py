@@ -0,0 +1,77 @@
+"""Tests for ProgressTracker buffering (the rich Progress is replaced by a stub)."""
+
+import pytest
+
+pytest.importorskip("rich")
+
+from ai_translate import progress as progress_module
+from ai_translate.progress import ProgressTracker
+
+
+class StubProgress:
+    """Records the advances pushed to it instead of drawing a bar."""
+
+    def __init__(self):
+        self.advances = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def add_task(self, description, total):
+        return 0
+
+    def update(self, task_id, advance=None, **kwargs):
+        if advance is not None:
+            self.advances.append(advance)
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(progress_module.time, "monotonic", fake)
+    return fake
+
+
+def make_tracker(total):
+    tracker = ProgressTracker(total)
+    tracker.progress = StubProgress()
+    return tracker
+
+
+class TestProgressTracker:
+    """Test ProgressTracker."""
+
+    def test_advances_are_coalesced_by_count(self, clock):
+        """Test updates are pushed in FLUSH_EVERY-sized chunks while time stands still."""
+        tracker = make_tracker(200)
+        with tracker:
+            for _ in range(150):
+                tracker.update()
+            assert tracker.progress.advances == [64, 64]
+        assert tracker.progress.advances == [64, 64, 22]
+
+    def test_advances_are_flushed_after_interval(self, clock):
+        """Test buffered updates are pushed once FLUSH_INTERVAL has passed."""
+        tracker = make_tracker(10)
+        with tracker:
+            tracker.update()
+            tracker.update()
+            assert tracker.progress.advances == []
+            clock.now += ProgressTracker.FLUSH_INTERVAL
+            tracker.update()
+            assert tracker.progress.advances == [3]
+            tracker.update(2)
+        assert tracker.progress.advances == [3, 2]
@@ -0,0 +1,35 @@
+"""Tests for token-bucket rate limiting."""
+
+import time
+
+import pytest
+
+from ai_translate.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    def test_burst_up_to_capacity(self):
+        """Test a full bucket allows `capacity` immediate acquisitions, then refuses."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_acquire_waits_for_refill(self):
+        """Test acquire blocks roughly until the next token is due."""
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.015
+
+    def test_per_minute(self):
+        """Test per_minute converts requests per minute to a per-second rate."""
+        bucket = TokenBucket.per_minute(30)
+        assert bucket.rate == pytest.approx(0.5)
+        assert bucket.capacity == 30
+
+    def test_invalid_rate(self):
+        """Test non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
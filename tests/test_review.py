@@ -0,0 +1,90 @@
+"""Tests for Review Manager."""
+
+import tempfile
+from pathlib import Path
+
+from ai_translate.policy import TranslationContext
+from ai_translate.review import ReviewManager
+from ai_translate.storage import TranslationStorage
+
+
+def make_storage(tmpdir, texts):
+    """Storage holding one translation per text, each flagged as needing review."""
+    storage = TranslationStorage(storage_path=Path(tmpdir), lang="ar")
+    context = TranslationContext(layer="B")
+    for text in texts:
+        storage.set(text, f"ar:{text}", context)
+        entry = storage.get_entry_by_source(text)
+        entry.needs_review = True
+        entry.review_status = "needs_review"
+    return storage
+
+
+def count_get_all(storage):
+    """Wrap storage.get_all and return a list that grows by one per call."""
+    calls = []
+    get_all = storage.get_all
+
+    def counting_get_all():
+        calls.append(1)
+        return get_all()
+
+    storage.get_all = counting_get_all
+    return calls
+
+
+class TestReviewManager:
+    """Test ReviewManager."""
+
+    def test_listing_is_cached_until_storage_changes(self):
+        """Test repeated listings reuse the cached result and approve drops the entry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = make_storage(tmpdir, ["Save", "Cancel"])
+            calls = count_get_all(storage)
+            manager = ReviewManager(storage)
+
+            assert [e.source_text for e in manager.list_needing_review()] == ["Save", "Cancel"]
+            assert [e.source_text for e in manager.list_needing_review()] == ["Save", "Cancel"]
+            assert len(calls) == 1
+
+            assert manager.approve("Save")
+            assert [e.source_text for e in manager.list_needing_review()] == ["Cancel"]
+            assert len(calls) == 2
+
+    def test_direct_storage_set_invalidates_listing(self):
+        """Test a storage.set outside the manager is picked up by the next listing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = make_storage(tmpdir, ["Save", "Cancel"])
+            manager = ReviewManager(storage)
+            assert len(manager.list_needing_review()) == 2
+
+            storage.set("Cancel", "إلغاء", TranslationContext(layer="B"), update_existing=True)
+            assert [e.source_text for e in manager.list_needing_review()] == ["Save"]
+
+    def test_deferred_approvals_save_once(self):
+        """Test approve(flush=False) defers saving until a single flush()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            texts = ["Save", "Cancel", "Delete"]
+            storage = make_storage(tmpdir, texts)
+            saves = []
+            save = storage.save
+
+            def counting_save():
+                saves.append(1)
+                save()
+
+            storage.save = counting_save
+            manager = ReviewManager(storage)
+
+            for text in texts:
+                assert manager.approve(text, flush=False)
+            assert saves == []
+            assert not storage.csv_path.exists()
+
+            manager.flush()
+            assert len(saves) == 1
+            assert manager.list_needing_review() == []
+            assert all(storage.get_entry_by_source(t).review_status == "approved" for t in texts)
+
+            reloaded = TranslationStorage(storage_path=Path(tmpdir), lang="ar")
+            assert {t: reloaded.get(t) for t in texts} == {t: f"ar:{t}" for t in texts}
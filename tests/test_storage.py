@@ -95,6 +95,17 @@ class TestTranslationStorage:
             assert content
             assert content[0].strip() == "Source,Translation"
 
+    def test_cr_only_csv_is_split_into_rows(self):
+        """CR-only line endings (old Mac/Excel exports) must still give one row per line."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            csv_path = base / "translations" / "ar.csv"
+            csv_path.parent.mkdir(parents=True)
+            csv_path.write_bytes("Hello,مرحبا\rWorld,عالم\r".encode("utf-8"))
+
+            storage = TranslationStorage(storage_path=base, lang="ar")
+            assert storage._translations == {"Hello": "مرحبا", "World": "عالم"}
+
     def test_header_csv_is_loaded_but_saved_headerless(self):
         """If a header CSV exists, we can read it, and we keep the header in output."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -117,3 +128,111 @@ class TestTranslationStorage:
             assert lines
             assert lines[0].strip() == "Source,Translation"
 
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            'Source,Translation\nHello,مرحبا\n"Save, now", احفظ \n"Two\nlines","سطران"\n,empty\n',
+            'Hello,مرحبا\n Padded ,"مبطن "\n007,٠٠٧\n',
+        ],
+    )
+    def test_arrow_reader_matches_csv_reader(self, content, monkeypatch):
+        """The optional pyarrow bulk reader must load the same rows as the csv module."""
+        pytest.importorskip("pyarrow")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            csv_path = base / "translations" / "ar.csv"
+            csv_path.parent.mkdir(parents=True)
+            csv_path.write_text(content, encoding="utf-8")
+
+            expected = TranslationStorage(storage_path=base, lang="ar")
+            monkeypatch.setattr(TranslationStorage, "ARROW_MIN_FILE_SIZE", 0)
+            storage = TranslationStorage(storage_path=base, lang="ar")
+
+            assert storage._read_arrow_rows() is not None
+            assert storage._translations == expected._translations
+            assert storage._csv_has_header == expected._csv_has_header
+
+    def test_save_skips_rewrite_when_unchanged(self):
+        """Saving without changes must leave the existing file untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            translations_dir = base / "translations"
+            translations_dir.mkdir(parents=True, exist_ok=True)
+            csv_path = translations_dir / "ar.csv"
+            csv_path.write_text("Hello,مرحبا\n", encoding="utf-8")
+
+            storage = TranslationStorage(storage_path=base, lang="ar")
+            context = TranslationContext(layer="A", app="test")
+            storage.set("Hello", "مرحبا", context, update_existing=True)  # same value
+            storage.save()
+            assert csv_path.read_text(encoding="utf-8") == "Hello,مرحبا\n"
+
+            storage.set("World", "عالم", context)
+            storage.save()
+            assert csv_path.read_text(encoding="utf-8").splitlines()[0] == "Source,Translation"
+
+    def test_entry_eviction_keeps_translations(self):
+        """Evicting cached entries must not drop translations from get() or save()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = TranslationStorage(storage_path=Path(tmpdir), lang="ar", max_entries=2)
+            context = TranslationContext(layer="A", app="test")
+            for i in range(5):
+                storage.set(f"Text {i}", f"نص {i}", context, "test.py", i)
+            assert len(storage._entries) == 2
+            assert storage.get("Text 0") == "نص 0"
+            assert storage.get_entry_by_source("Text 0").translated_text == "نص 0"
+            assert len(storage.get_all()) == 5
+            storage.save()
+
+            storage2 = TranslationStorage(storage_path=Path(tmpdir), lang="ar")
+            assert all(storage2.get(f"Text {i}") == f"نص {i}" for i in range(5))
+
+    def test_get_all_does_not_evict_entry_metadata(self):
+        """A full listing over max_entries must keep cached entries and their review state."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "translations" / "ar.csv"
+            csv_path.parent.mkdir(parents=True)
+            csv_path.write_text("".join(f"Text {i},نص {i}\n" for i in range(5)), encoding="utf-8")
+            storage = TranslationStorage(storage_path=Path(tmpdir), lang="ar", max_entries=2)
+            context = TranslationContext(layer="B", app="test")
+            storage.set("Approved", "موافق", context, "test.py", 7)
+            entry = storage.get_entry_by_source("Approved")
+            entry.review_status = "approved"
+            entry.confidence = 0.99
+
+            assert len(storage.get_all()) == 6
+            assert list(storage._entries) == ["Approved"]
+            kept = storage.get_entry_by_source("Approved")
+            assert kept is entry
+            assert kept.context.layer == "B" and kept.line_number == 7
+            assert kept.confidence == 0.99
+
+    def test_quoted_csv_with_header_is_loaded(self):
+        """Quoted fields go through the csv module and still honour the Source,Translation header."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            translations_dir = base / "translations"
+            translations_dir.mkdir(parents=True, exist_ok=True)
+            csv_path = translations_dir / "ar.csv"
+            csv_path.write_text('Source,Translation\n"Hello, World","مرحبا، عالم"\nNew,جديد\n', encoding="utf-8")
+
+            storage = TranslationStorage(storage_path=base, lang="ar")
+            assert storage.get("Hello, World") == "مرحبا، عالم"
+            assert storage.get("New") == "جديد"
+            assert storage.get("Source") is None
+
+    def test_deduplicate_keeps_first_normalized_spelling(self):
+        """Whitespace variants collapse to the first source seen."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = TranslationStorage(storage_path=Path(tmpdir), lang="ar")
+            ctx = TranslationContext(layer="A")
+            storage.set("Hello  World", "أ", ctx)
+            storage.set("Hello World", "ب", ctx)
+            storage.set("Other", "ج", ctx)
+
+            storage.deduplicate()
+
+            assert storage.get("Hello  World") == "أ"
+            assert storage.get("Hello World") is None
+            assert storage.get("Other") == "ج"
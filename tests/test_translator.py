@@ -0,0 +1,441 @@
+"""Tests for Translator (Groq calls are replaced by a fake client)."""
+
+import json
+import re
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("groq")
+
+from ai_translate.cache import TranslationCache
+from ai_translate.translator import Translator, _clean_translation, _split_long_text
+
+
+class FakeClient:
+    """Minimal stand-in for the Groq client: returns canned replies and records prompts."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        content = self.reply(prompt) if callable(self.reply) else self.reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_translator(reply, **kwargs):
+    translator = Translator(api_key="test-key", **kwargs)
+    translator.client = FakeClient(reply)
+    return translator
+
+
+def echo_batch(prompt):
+    """Reply to a batch prompt with a JSON array of "tr:<text>" in prompt order."""
+    return json.dumps([f"tr:{t}" for t in re.findall(r"^\d+\. (.*)$", prompt, re.M)])
+
+
+class TestTranslator:
+    """Test Translator."""
+
+    def test_translate_uses_cache_for_repeats(self):
+        """Test identical requests hit the in-process cache instead of the API."""
+        translator = make_translator("مرحبا بالعالم")
+        assert translator.translate("Hello World", "ar") == ("مرحبا بالعالم", "ok")
+        assert translator.translate("Hello World", "ar") == ("مرحبا بالعالم", "ok")
+        assert len(translator.client.prompts) == 1
+        assert translator.get_stats()["cached"] == 1
+
+    def test_batch_sends_only_cache_misses(self):
+        """Test cached texts are spliced back in order and not re-sent."""
+        translator = make_translator("مرحبا بالعالم")
+        translator.translate("Hello World", "ar")
+
+        translator.client.reply = json.dumps(["صباح الخير"])
+        results = translator.translate_batch(["Good Morning", "Hello World"], "ar")
+
+        assert results == [("صباح الخير", "ok"), ("مرحبا بالعالم", "ok")]
+        assert "Hello World" not in translator.client.prompts[-1]
+
+    def test_batch_translates_duplicates_once(self):
+        """Test repeated texts in a batch are sent once and fanned back out."""
+        translator = make_translator(json.dumps(["حفظ", "إلغاء"]))
+        results = translator.translate_batch(["Save", "Cancel", "Save"], "ar")
+
+        assert results == [("حفظ", "ok"), ("إلغاء", "ok"), ("حفظ", "ok")]
+        assert len(translator.client.prompts) == 1
+        assert translator.client.prompts[0].count("Save") == 1
+
+    def test_mask_and_restore_placeholders(self):
+        """Test every placeholder kind is masked with a token and restored verbatim."""
+        translator = make_translator("")
+        text = "Hi {0}, {{ doc.name }} has %(count)s items (%s/%d)"
+        masked, placeholder_map = translator._mask_placeholders(text)
+
+        assert "{" not in masked and "%" not in masked
+        assert list(placeholder_map[1]) == ["{0}", "{{ doc.name }}", "%(count)s", "%s", "%d"]
+        assert translator._restore_placeholders(masked, placeholder_map) == text
+        assert translator._mask_placeholders("Save") == ("Save", ((), ()))
+
+    def test_language_guard_rejects_cjk_for_arabic(self):
+        """Test CJK-only output is rejected for Arabic, mixed or other targets are not."""
+        translator = make_translator("")
+        assert translator._fails_language_guard("你好世界", "ar")
+        assert not translator._fails_language_guard("مرحبا 你好", "ar")
+        assert not translator._fails_language_guard("مرحبا", "ar")
+        assert not translator._fails_language_guard("你好世界", "zh")
+
+    def test_concurrent_batches_keep_input_order(self):
+        """Test batches dispatched to worker threads come back in input order."""
+        translator = make_translator(echo_batch, concurrency=4)
+        texts = [f"Label number {i}" for i in range(45)]
+        results = translator.translate_batch(texts, "ar", batch_size=10)
+
+        assert results == [(f"tr:{t}", "ok") for t in texts]
+        assert len(translator.client.prompts) == 5
+        assert translator.get_stats()["translated"] == 45
+
+    def test_batch_failure_falls_back_to_individual_calls(self):
+        """Test an unparseable batch reply falls back to per-text calls, in order."""
+
+        def reply(prompt):
+            if "Texts:" in prompt:
+                return "unparseable"
+            return "tr:" + re.search(r"^Text: (.*)$", prompt, re.M).group(1)
+
+        translator = make_translator(reply, concurrency=4)
+        texts = ["First label", "Second label", "Third label"]
+        results = translator.translate_batch(texts, "ar")
+
+        assert results == [(f"tr:{t}", "ok") for t in texts]
+
+    def test_translate_bulk_maps_batch_job_output_to_inputs(self):
+        """Test bulk results come back in input order; texts missing from the job are retried."""
+        translator = make_translator(echo_batch)
+        translator.BULK_MIN_TEXTS = 2
+        uploaded = {}
+
+        def create_file(file, purpose):
+            uploaded["lines"] = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+            return SimpleNamespace(id="file-in")
+
+        def file_content(file_id):
+            # Answer every request except the last one
+            rows = [
+                {
+                    "custom_id": req["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": "bulk:" + req["custom_id"]}}]},
+                    },
+                }
+                for req in uploaded["lines"][:-1]
+            ]
+            data = "\n".join(json.dumps(r) for r in rows).encode("utf-8")
+            return SimpleNamespace(read=lambda: data)
+
+        job = SimpleNamespace(id="batch-1", status="completed", output_file_id="file-out")
+        translator.client.files = SimpleNamespace(create=create_file, content=file_content)
+        translator.client.batches = SimpleNamespace(create=lambda **kwargs: job)
+
+        texts = ["Sales Order", "Customer Name", "Sales Order", "Delivery Note"]
+        results = translator.translate_bulk(texts, "ar")
+
+        assert len(uploaded["lines"]) == 3
+        assert results == [
+            ("bulk:0", "ok"),
+            ("bulk:1", "ok"),
+            ("bulk:0", "ok"),
+            ("tr:Delivery Note", "ok"),
+        ]
+
+    def test_translate_bulk_stops_using_unavailable_batch_api(self):
+        """Test a 404 from the Batch API falls back to batched calls and isn't retried."""
+        import groq
+        import httpx
+
+        translator = make_translator(echo_batch)
+        translator.BULK_MIN_TEXTS = 2
+        uploads = []
+
+        def create_file(file, purpose):
+            uploads.append(file)
+            request = httpx.Request("POST", "https://api.groq.com/openai/v1/files")
+            raise groq.NotFoundError(
+                "not found", response=httpx.Response(404, request=request), body=None
+            )
+
+        translator.client.files = SimpleNamespace(create=create_file)
+        translator.client.batches = SimpleNamespace()
+
+        texts = ["Sales Order", "Customer Name"]
+        assert translator.translate_bulk(texts, "ar") == [(f"tr:{t}", "ok") for t in texts]
+        assert not translator.bulk_api_available
+        translator.translate_bulk(["Delivery Note", "Sales Invoice"], "ar")
+        assert len(uploads) == 1
+
+    def test_disk_cache_is_reused_across_translators(self):
+        """Test a new Translator reuses translations persisted by an earlier one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = make_translator("مرحبا بالعالم", disk_cache=TranslationCache(Path(tmpdir)))
+            assert first.translate("Hello World", "ar") == ("مرحبا بالعالم", "ok")
+
+            second = make_translator("unused", disk_cache=TranslationCache(Path(tmpdir)))
+            assert second.translate_batch(["Hello World"], "ar") == [("مرحبا بالعالم", "ok")]
+            assert second.client.prompts == []
+
+    def test_wrong_language_reply_is_rejected(self):
+        """Test a CJK reply for an Arabic target is rejected and not cached."""
+        translator = make_translator("你好世界")
+        assert translator.translate("Hello World", "ar") == (None, "rejected")
+        assert translator.translate("Hello World", "ar") == (None, "rejected")
+        assert len(translator.client.prompts) == 2
+        assert translator.get_stats()["rejected"] == 2
+
+    def test_empty_reply_is_rejected_and_never_cached(self):
+        """Test a reply that is only an instruction echo is rejected and not persisted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            disk_cache = TranslationCache(Path(tmpdir))
+            translator = make_translator("Rules:\n", disk_cache=disk_cache)
+            assert translator.translate("Hello World", "ar") == (None, "rejected")
+            key = ("en", "ar", "", "Hello World")
+            assert disk_cache.get(Translator._disk_key(key)) is None
+
+            # An empty entry left by an older run is treated as a miss
+            disk_cache.set(Translator._disk_key(key), "")
+            translator.client.reply = "مرحبا بالعالم"
+            assert translator.translate("Hello World", "ar") == ("مرحبا بالعالم", "ok")
+            assert len(translator.client.prompts) == 2
+
+    def test_batch_size_adapts_to_failures_and_successes(self):
+        """Test failed batches halve the effective batch size and fast successes grow it."""
+        translator = make_translator("unparseable", concurrency=1)
+        translator.translate_batch([f"Label {i}" for i in range(80)], "ar", batch_size=40)
+        assert translator.effective_batch_size == 10
+
+        translator.client.reply = echo_batch
+        translator.translate_batch([f"Other label {i}" for i in range(30)], "ar")
+        assert translator.effective_batch_size > 10
+
+    def test_batch_size_grows_and_shrinks_within_bounds(self):
+        """Test fast successes grow batches up to MAX_BATCH_SIZE, failures halve to MIN_BATCH_SIZE."""
+
+        def batch_sizes(translator):
+            return [
+                len(re.findall(r"^\d+\. ", prompt, re.M))
+                # A failed batch is retried on the next model with the same prompt
+                for prompt in dict.fromkeys(translator.client.prompts)
+                if "Texts:" in prompt
+            ]
+
+        translator = make_translator(echo_batch, concurrency=1)
+        translator.translate_batch([f"Label {i}" for i in range(250)], "ar", batch_size=20)
+        assert batch_sizes(translator)[:6] == [20, 25, 31, 38, 47, 50]
+        assert max(batch_sizes(translator)) == Translator.MAX_BATCH_SIZE
+        assert translator.effective_batch_size == Translator.MAX_BATCH_SIZE
+
+        translator.client.prompts.clear()
+        translator.client.reply = "unparseable"
+        translator.translate_batch([f"Failing {i}" for i in range(117)], "ar")
+        assert batch_sizes(translator) == [50, 25, 12, 10, 10, 10]
+        assert translator.effective_batch_size == Translator.MIN_BATCH_SIZE
+
+        # Successful but slower than the latency target: the size holds
+        translator.client.reply = echo_batch
+        translator.BATCH_LATENCY_TARGET = -1.0
+        translator.translate_batch([f"Slow {i}" for i in range(30)], "ar")
+        assert translator.effective_batch_size == Translator.MIN_BATCH_SIZE
+
+    def test_batch_size_ignores_cache_hits_and_request_errors(self):
+        """Test only replies from the API tune the batch size."""
+        translator = make_translator(echo_batch, concurrency=1)
+        labels = [f"Label {i}" for i in range(20)]
+        translator.translate_batch(labels, "ar", batch_size=20)
+        assert translator.effective_batch_size == 25
+
+        # Served entirely from cache: no request, no evidence
+        translator.translate_batch(labels, "ar")
+        assert translator.effective_batch_size == 25
+
+        def unreachable(prompt):
+            raise ConnectionError("network down")
+
+        # Network/model errors are not parse failures
+        translator.client.reply = unreachable
+        translator.translate_batch([f"Other {i}" for i in range(20)], "ar")
+        assert translator.effective_batch_size == 25
+
+    def test_rate_limiters_follow_mode(self):
+        """Test limiters apply in slow mode or when requested, never by default."""
+        assert make_translator("")._rate_limiters == {}
+        assert set(make_translator("", slow_mode=True)._rate_limiters) == set(
+            Translator.MODEL_REQUESTS_PER_MINUTE
+        )
+        limited = make_translator("", requests_per_minute=120)
+        assert all(b.rate == 2.0 for b in limited._rate_limiters.values())
+        assert make_translator("")._token_limiters == {}
+        assert make_translator("")._slow_mode_pacer is None
+        assert make_translator("", slow_mode=True)._slow_mode_pacer.rate == 2.0
+        assert make_translator("", slow_mode=True)._token_limiters["llama-3.1-8b-instant"].rate == 100
+
+    def test_token_limiter_charges_prompt_and_budget(self):
+        """Test each request takes its prompt size plus max_tokens from the token bucket."""
+        translator = make_translator("مرحبا بالعالم", tokens_per_minute=6000)
+        bucket = translator._token_limiters["llama-3.3-70b-versatile"]
+        translator.translate("Hello World", "ar")
+        assert 6000 - 200 < bucket._tokens < 6000 - Translator.MIN_MAX_TOKENS
+
+    def test_max_tokens_scale_with_text_length(self):
+        """Test the generation budget grows with the source text and stays clamped."""
+        translator = make_translator("")
+        short = translator._estimate_max_tokens("Save", "ar")
+        medium = translator._estimate_max_tokens("word " * 100, "ar")
+        assert short == Translator.MIN_MAX_TOKENS
+        assert short < medium < translator._estimate_max_tokens("word " * 100, "fr")
+        assert translator._estimate_max_tokens("x" * 100000, "ar") == Translator.MAX_MAX_TOKENS
+
+    def test_clean_translation_strips_echoes_and_markers(self):
+        """Test instruction echoes and translation markers are removed from replies."""
+        assert _clean_translation("مرحبا بالعالم") == "مرحبا بالعالم"
+        assert _clean_translation("Rules:\nTranslation: مرحبا\n") == "مرحبا"
+        assert _clean_translation("\nسطر أول\n\nسطر ثان\n") == "سطر أول\n\nسطر ثان"
+        # Only the colon after the label counts, not an earlier one
+        assert _clean_translation("الوقت: 10 - translation: الوقت") == "الوقت"
+        # "ترجمة" used as a word, not a label
+        assert _clean_translation("إعدادات الترجمة") == "إعدادات الترجمة"
+
+    def test_batch_reply_items_are_aligned_by_number(self):
+        """Test numbered replies lose their prefixes, and JSON extras are realigned."""
+        translator = make_translator("")
+        texts = ["Save", "Cancel"]
+        assert translator._parse_batch_response("1. حفظ\n2. إلغاء", texts, "ar") == [
+            ("حفظ", "ok"),
+            ("إلغاء", "ok"),
+        ]
+        reply = json.dumps(["Translations:", "2. إلغاء", "1. حفظ"], ensure_ascii=False)
+        assert translator._parse_batch_response(reply, texts, "ar") == [
+            ("حفظ", "ok"),
+            ("إلغاء", "ok"),
+        ]
+
+    def test_enqueued_texts_share_batched_calls(self):
+        """Test requests queued together are packed into one call and futures resolve in order."""
+        translator = make_translator(echo_batch)
+        translator.ENQUEUE_MAX_WAIT = 0.5
+        texts = ["Sales Order", "Customer Name", "Delivery Note"]
+        futures = [translator.enqueue(text, "ar") for text in texts]
+
+        assert [f.result(timeout=5) for f in futures] == [(f"tr:{t}", "ok") for t in texts]
+        assert len(translator.client.prompts) == 1
+        translator.close()
+        assert translator._queue_worker is None
+
+    def test_only_unavailable_models_are_disabled(self):
+        """Test a 404 disables the model, while other errors just move on to the next one."""
+        import groq
+        import httpx
+
+        request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+        errors = [
+            groq.NotFoundError(
+                "model not found", response=httpx.Response(404, request=request), body=None
+            )
+        ]
+
+        def reply(prompt):
+            if errors:
+                raise errors.pop(0)
+            return "مرحبا"
+
+        translator = make_translator(reply)
+        assert translator.translate("Hello World", "ar") == ("مرحبا", "ok")
+
+        errors.append(
+            groq.RateLimitError(
+                "rate limited", response=httpx.Response(429, request=request), body=None
+            )
+        )
+        assert translator.translate("Good Morning", "ar") == (None, "failed")
+        assert translator.disabled_models == {"llama-3.3-70b-versatile"}
+
+    def test_short_texts_can_be_routed_to_the_fast_model(self):
+        """Test short labels try FAST_MODEL first and fall back when its reply is rejected."""
+        translator = make_translator("", route_short_texts=True)
+        models = []
+
+        replies = {
+            (Translator.FAST_MODEL, "Save Draft"): "حفظ",
+            (Translator.FAST_MODEL, "Good Morning"): "早上好",
+            ("llama-3.3-70b-versatile", "Good Morning"): "صباح الخير",
+            ("llama-3.3-70b-versatile", "Save {0}"): "حفظ {0}",
+        }
+
+        def create(model, messages, **kwargs):
+            models.append(model)
+            text = re.search(r"^Text: (.*)$", messages[-1]["content"], re.M).group(1)
+            content = replies[(model, text.replace("__PH_BRACE_0__", "{0}"))]
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+
+        translator.client.chat.completions.create = create
+        assert translator.translate("Save Draft", "ar") == ("حفظ", "ok")
+        assert translator.translate("Good Morning", "ar") == ("صباح الخير", "ok")
+        assert translator.translate("Save {0}", "ar") == ("حفظ {0}", "ok")
+        assert models == [
+            Translator.FAST_MODEL,
+            Translator.FAST_MODEL,
+            "llama-3.3-70b-versatile",
+            "llama-3.3-70b-versatile",
+        ]
+        assert translator.get_stats()["routed"] == 1
+        assert translator.get_stats()["rejected"] == 0
+        assert translator.current_model_index == 0
+
+    def test_long_texts_are_translated_in_sentence_pieces(self):
+        """Test long texts are split at sentence ends, translated per piece and rejoined."""
+        text = "First sentence here. Second one follows!  Third, with {name}. That is all"
+        assert "".join(_split_long_text(text, 30)) == text
+        assert _split_long_text(text, 30)[0] == "First sentence here. "
+        assert _split_long_text("Total: {{ a. b }}. Next", 5) == ["Total: {{ a. b }}. ", "Next"]
+
+        def reply(prompt):
+            return "tr:" + re.search(r"^Text: (.*)$", prompt, re.M).group(1)
+
+        translator = make_translator(reply, concurrency=4)
+        translator.LONG_TEXT_CHARS = 30
+        translated, status = translator.translate(text, "fr")
+
+        assert status == "ok"
+        assert translated == (
+            "tr:First sentence here. tr:Second one follows!  tr:Third, with {name}. tr:That is all"
+        )
+        assert len(translator.client.prompts) == 4
+
+    def test_long_text_pieces_skip_policy_and_fail_as_a_whole(self):
+        """Test pieces bypass the policy, and one rejected piece fails the whole text."""
+        text = "First sentence here. Second one follows!  customer_name"
+
+        def reply(prompt):
+            return "tr:" + re.search(r"^Text: (.*)$", prompt, re.M).group(1)
+
+        translator = make_translator(reply)
+        translator.LONG_TEXT_CHARS = 30
+        assert translator.translate(text, "fr") == (
+            "tr:First sentence here. tr:Second one follows!  tr:customer_name",
+            "ok",
+        )
+
+        def reject_second(prompt):
+            piece = re.search(r"^Text: (.*)$", prompt, re.M).group(1)
+            return "你好" if piece.startswith("Second") else "مرحبا"
+
+        translator = make_translator(reject_second)
+        translator.LONG_TEXT_CHARS = 30
+        assert translator.translate(text, "ar") == (None, "rejected")
+        assert translator._cache_get(("en", "ar", "", text)) is None